@@ -1,17 +1,23 @@
+import os
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import ClassVar, Dict, Any, Optional, Tuple
 import json
+try:
+    import orjson  # optional, faster settings.json load/save
+except Exception:
+    orjson = None
+
+# Directories derived from BASE_DIR: attribute name -> subdirectory
+_DERIVED_DIRS = {"DOWNLOADS_DIR": "downloads", "LOGS_DIR": "logs", "CONFIG_DIR": "config"}
 
 @dataclass
 class Config:
-    """Application configuration settings."""
+    """Application configuration settings (use ``Config.instance()``)."""
     
     # Directories
-    BASE_DIR: Path = Path(__file__).parent.parent.parent
-    DOWNLOADS_DIR: Path = BASE_DIR / "downloads"
-    LOGS_DIR: Path = BASE_DIR / "logs"
-    CONFIG_DIR: Path = BASE_DIR / "config"
+    BASE_DIR: Path = Path(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
     
     # Application settings
     DEFAULT_OUTPUT_FORMAT: str = "mp4"
@@ -23,21 +29,66 @@ class Config:
     WINDOW_WIDTH: int = 1200
     WINDOW_HEIGHT: int = 800
     THEME: str = "dark"
+
+    # Derived directories: computed from BASE_DIR on first access, then plain
+    # instance attributes (settings.json or callers may still override them)
+    @cached_property
+    def DOWNLOADS_DIR(self) -> Path:
+        return self.BASE_DIR / "downloads"
+
+    @cached_property
+    def LOGS_DIR(self) -> Path:
+        return self.BASE_DIR / "logs"
+
+    @cached_property
+    def CONFIG_DIR(self) -> Path:
+        return self.BASE_DIR / "config"
+
+    # Process-wide instance returned by instance()
+    _instance: ClassVar[Optional['Config']] = None
+    # Last loaded instance, keyed by (path, mtime) so unchanged files are not re-parsed
+    _cached: ClassVar[Optional['Config']] = None
+    _cached_key: ClassVar[Optional[Tuple[Path, Optional[float]]]] = None
+    
+    @classmethod
+    def instance(cls) -> 'Config':
+        """Return the shared configuration, loading settings.json on first use."""
+        if cls._instance is None:
+            cls._instance = cls.load_from_file()
+        return cls._instance
     
     @classmethod
     def load_from_file(cls, config_path: Optional[Path] = None) -> 'Config':
-        """Load configuration from JSON file."""
+        """Load configuration from JSON file (cached until the file's mtime changes)."""
         if config_path is None:
-            config_path = cls.CONFIG_DIR / "settings.json"
+            config_path = cls.BASE_DIR / "config" / "settings.json"
+
+        try:
+            mtime = config_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        key = (config_path, mtime)
+        if cls._cached is not None and cls._cached_key == key:
+            return cls._cached
             
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-                # Update class attributes with loaded data
-                for key, value in data.items():
-                    if hasattr(cls, key):
-                        setattr(cls, key, value)
-        return cls()
+        overrides: Dict[str, Any] = {}
+        dir_overrides: Dict[str, Path] = {}
+        if mtime is not None:
+            raw = config_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            for f in fields(cls):
+                if f.name in data:
+                    value = data[f.name]
+                    overrides[f.name] = Path(value) if f.type is Path else value
+            for name in _DERIVED_DIRS:
+                if name in data:
+                    dir_overrides[name] = Path(data[name])
+        config = cls(**overrides)
+        for name, value in dir_overrides.items():
+            setattr(config, name, value)
+        cls._cached = config
+        cls._cached_key = key
+        return config
     
     def save_to_file(self, config_path: Optional[Path] = None):
         """Save current configuration to JSON file."""
@@ -46,10 +97,19 @@ class Config:
             
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        config_data = {
-            attr: getattr(self, attr) for attr in dir(self)
-            if not attr.startswith('_') and not callable(getattr(self, attr))
-        }
+        config_data: Dict[str, Any] = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            config_data[f.name] = str(value) if isinstance(value, Path) else value
+        # Derived dirs are only persisted when overridden
+        for name, subdir in _DERIVED_DIRS.items():
+            value = self.__dict__.get(name)
+            if value is not None and value != self.BASE_DIR / subdir:
+                config_data[name] = str(value)
         
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f, indent=2, default=str)
+        if orjson:
+            config_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w') as f:
+                json.dump(config_data, f, indent=2)
+
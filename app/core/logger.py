@@ -7,7 +7,7 @@ def setup_logging(level=logging.INFO):
     """Setup application logging configuration."""
     
     # Create logs directory
-    Config.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    Config.instance().LOGS_DIR.mkdir(parents=True, exist_ok=True)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -26,7 +26,7 @@ def setup_logging(level=logging.INFO):
     
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
-        Config.LOGS_DIR / "app.log",
+        Config.instance().LOGS_DIR / "app.log",
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
     )
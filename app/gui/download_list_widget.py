@@ -1,115 +1,225 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, 
-                            QLabel, QProgressBar, QPushButton,
-                            QHBoxLayout, QFrame)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QListView,
+                            QStyledItemDelegate, QStyle, QStyleOptionButton,
+                            QStyleOptionProgressBar, QApplication, QAbstractItemView)
+from PyQt6.QtCore import (Qt, QTimer, QAbstractListModel, QModelIndex, QRect,
+                          QSize, QEvent, pyqtSignal)
+from PyQt6.QtGui import QColor, QFont
 from app.services.download_service import DownloadService
-from app.models.download_task import DownloadTask, TaskStatus
+from app.models.download_task import DownloadTask, TERMINAL_STATUSES
+
+TaskRole = Qt.ItemDataRole.UserRole + 1
+
+# Parsed once for the whole list widget (descendants are matched by object name)
+_LIST_CSS = "QLabel#downloadsHeader { font-size: 16px; font-weight: bold; padding: 10px; }"
+_URL_COLOR = QColor("gray")
+_URL_FONT_PX = 10
+
+class DownloadListModel(QAbstractListModel):
+    """List model over download tasks, in the order they were added."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._task_ids = []  # row -> task_id
+        self._rows = {}  # task_id -> row
+        self._tasks = {}  # task_id -> DownloadTask
+        self._painted = {}  # task_id -> fields last shown, see _row_state
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._task_ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[self._task_ids[index.row()]]
+        if role == TaskRole:
+            return task
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task.title or task.url
+        return None
+
+    @staticmethod
+    def _row_state(task: DownloadTask) -> tuple:
+        """Everything the delegate renders for a task."""
+        return (task.title, int(task.progress), task.status, task.download_speed or "")
+
+    def add_task(self, task: DownloadTask):
+        """Append a task as a new row."""
+        row = len(self._task_ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._task_ids.append(task.id)
+        self._rows[task.id] = row
+        self._tasks[task.id] = task
+        self._painted[task.id] = self._row_state(task)
+        self.endInsertRows()
+
+    def update_task(self, task: DownloadTask):
+        """Store the latest task state and repaint its row if anything visible changed."""
+        row = self._rows.get(task.id)
+        if row is None:
+            return
+        self._tasks[task.id] = task
+        state = self._row_state(task)
+        if state == self._painted.get(task.id):
+            return
+        self._painted[task.id] = state
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+class DownloadItemDelegate(QStyledItemDelegate):
+    """Paints a download row (title, URL, progress, status, cancel button) on demand."""
+
+    cancel_requested = pyqtSignal(str)  # task_id
+
+    ROW_HEIGHT = 84
+    MARGIN = 8
+    LINE_HEIGHT = 18
+    BUTTON_WIDTH = 80
+    STATUS_WIDTH = 90
+    SPEED_WIDTH = 90
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._url_font = None  # derived from the view font on first paint
+
+    def _layout(self, rect: QRect) -> dict:
+        """Compute sub-rectangles for one row; shared by paint() and editorEvent()."""
+        r = rect.adjusted(self.MARGIN, self.MARGIN // 2, -self.MARGIN, -self.MARGIN // 2)
+        title = QRect(r.left(), r.top(), r.width(), self.LINE_HEIGHT)
+        url = QRect(r.left(), title.bottom() + 2, r.width(), self.LINE_HEIGHT - 4)
+        row_top = url.bottom() + 6
+        row_h = r.bottom() - row_top
+        button = QRect(r.right() - self.BUTTON_WIDTH, row_top, self.BUTTON_WIDTH, row_h)
+        speed = QRect(button.left() - 6 - self.SPEED_WIDTH, row_top, self.SPEED_WIDTH, row_h)
+        status = QRect(speed.left() - 6 - self.STATUS_WIDTH, row_top, self.STATUS_WIDTH, row_h)
+        progress = QRect(r.left(), row_top, max(0, status.left() - 6 - r.left()), row_h)
+        return {"title": title, "url": url, "progress": progress,
+                "status": status, "speed": speed, "button": button}
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        task = index.data(TaskRole)
+        if task is None:
+            return
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        rects = self._layout(option.rect)
+        fm = option.fontMetrics
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        painter.save()
+        painter.setPen(option.palette.mid().color())
+        painter.drawRect(option.rect.adjusted(1, 1, -2, -2))
 
-class DownloadItemWidget(QFrame):
-    """Widget representing a single download item."""
-    
-    def __init__(self, task: DownloadTask, download_service: DownloadService):
-        super().__init__()
-        self.task = task
-        self.download_service = download_service
-        self.init_ui()
-    
-    def init_ui(self):
-        """Initialize the UI for this download item."""
-        self.setFrameStyle(QFrame.Shape.Box)
-        layout = QVBoxLayout(self)
-        
         # Title and URL
-        title_label = QLabel(f"Title: {self.task.title or 'Loading...'}")
-        url_label = QLabel(f"URL: {self.task.url}")
-        url_label.setStyleSheet("color: gray; font-size: 10px;")
-        
-        layout.addWidget(title_label)
-        layout.addWidget(url_label)
-        
+        painter.setPen(option.palette.text().color())
+        title = f"Title: {task.title or 'Loading...'}"
+        painter.drawText(rects["title"], align,
+                         fm.elidedText(title, Qt.TextElideMode.ElideRight, rects["title"].width()))
+        if self._url_font is None:
+            self._url_font = QFont(option.font)
+            self._url_font.setPixelSize(_URL_FONT_PX)
+        painter.setFont(self._url_font)
+        painter.setPen(_URL_COLOR)
+        painter.drawText(rects["url"], align, f"URL: {task.url}")
+        painter.setFont(option.font)
+        painter.setPen(option.palette.text().color())
+
         # Progress section
-        progress_layout = QHBoxLayout()
-        
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setMinimum(0)
-        self.progress_bar.setMaximum(100)
-        self.progress_bar.setValue(int(self.task.progress))
-        
-        self.status_label = QLabel(self.task.status.value.capitalize())
-        self.speed_label = QLabel(self.task.download_speed or "")
-        
-        progress_layout.addWidget(self.progress_bar)
-        progress_layout.addWidget(self.status_label)
-        progress_layout.addWidget(self.speed_label)
-        
-        # Control buttons
-        self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.clicked.connect(self.cancel_download)
-        progress_layout.addWidget(self.cancel_btn)
-        
-        layout.addLayout(progress_layout)
-    
-    def update_task(self, task: DownloadTask):
-        """Update the widget with new task data."""
-        self.task = task
-        self.progress_bar.setValue(int(task.progress))
-        self.status_label.setText(task.status.value.capitalize())
-        self.speed_label.setText(task.download_speed or "")
-        
-        # Update cancel button state
-        if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-            self.cancel_btn.setEnabled(False)
-            self.cancel_btn.setText("Finished")
-    
-    def cancel_download(self):
-        """Cancel this download."""
-        self.download_service.cancel_download(self.task.id)
+        bar = QStyleOptionProgressBar()
+        bar.rect = rects["progress"]
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = int(task.progress)
+        bar.text = f"{int(task.progress)}%"
+        bar.textVisible = True
+        bar.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Horizontal
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, widget)
+
+        painter.drawText(rects["status"], align, task.status.value.capitalize())
+        painter.drawText(rects["speed"], align, task.download_speed or "")
+
+        # Cancel button
+        finished = task.status in TERMINAL_STATUSES
+        btn = QStyleOptionButton()
+        btn.rect = rects["button"]
+        btn.text = "Finished" if finished else "Cancel"
+        btn.state = QStyle.StateFlag.State_Raised
+        if not finished:
+            btn.state |= QStyle.StateFlag.State_Enabled
+        style.drawControl(QStyle.ControlElement.CE_PushButton, btn, painter, widget)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            task = index.data(TaskRole)
+            if task is not None and self._layout(option.rect)["button"].contains(event.position().toPoint()):
+                if task.status not in TERMINAL_STATUSES:
+                    self.cancel_requested.emit(task.id)
+                return True
+        return super().editorEvent(event, model, option, index)
 
 class DownloadListWidget(QWidget):
     """Widget for displaying list of downloads."""
-    
+
+    # Coalesce task updates into at most one widget refresh per frame (~30 fps)
+    UPDATE_INTERVAL_MS = 33
+
     def __init__(self, download_service: DownloadService):
         super().__init__()
         self.download_service = download_service
-        self.download_items = {}  # task_id -> DownloadItemWidget
+        self._dirty = set()  # task ids updated since last flush
+        self._pending = {}  # task_id -> latest DownloadTask
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_updates)
         self.init_ui()
         self.setup_connections()
-    
+
     def init_ui(self):
         """Initialize the UI."""
         layout = QVBoxLayout(self)
-        
+        self.setStyleSheet(_LIST_CSS)
+
         # Header
         header = QLabel("Downloads")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        header.setObjectName("downloadsHeader")
         layout.addWidget(header)
-        
-        # Scroll area for download items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
-        self.scroll_widget = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_widget)
-        self.scroll_layout.addStretch()
-        
-        scroll_area.setWidget(self.scroll_widget)
-        layout.addWidget(scroll_area)
-    
+
+        # Rows are painted by the delegate; only visible ones are drawn
+        self.model = DownloadListModel(self)
+        self.delegate = DownloadItemDelegate(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        layout.addWidget(self.list_view)
+
     def setup_connections(self):
         """Setup signal connections."""
         self.download_service.task_added.connect(self.add_download_item)
         self.download_service.task_updated.connect(self.update_download_item)
-    
+        self.delegate.cancel_requested.connect(self.download_service.cancel_download)
+
     def add_download_item(self, task: DownloadTask):
         """Add a new download item to the list."""
-        item_widget = DownloadItemWidget(task, self.download_service)
-        
-        # Insert before the stretch
-        self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, item_widget)
-        self.download_items[task.id] = item_widget
-    
+        self.model.add_task(task)
+
     def update_download_item(self, task: DownloadTask):
-        """Update an existing download item."""
-        if task.id in self.download_items:
-            self.download_items[task.id].update_task(task)
+        """Mark a download item dirty; rows are refreshed on the next flush."""
+        self._dirty.add(task.id)
+        self._pending[task.id] = task
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_updates(self):
+        """Apply the latest state of every dirty task to its row."""
+        dirty, self._dirty = self._dirty, set()
+        for task_id in dirty:
+            task = self._pending.pop(task_id, None)
+            if task is not None:
+                self.model.update_task(task)
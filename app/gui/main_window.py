@@ -1,4 +1,6 @@
+import functools
 import logging
+import re
 import sys
 import shutil  # new
 from pathlib import Path
@@ -6,38 +8,80 @@ from PyQt6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout,
                             QWidget, QPushButton, QLineEdit, QLabel,
                             QComboBox, QCheckBox, QSplitter, QStatusBar, QTabWidget,
                             QMessageBox, QFileDialog)  # + QFileDialog
-from PyQt6.QtCore import Qt, QSettings  # + QSettings
+from PyQt6.QtCore import Qt, QSettings, QTimer  # + QSettings
 from app.gui.download_list_widget import DownloadListWidget
 from app.services.download_service import DownloadService
 from app.models.download_task import TaskType, TaskStatus  # ensure TaskStatus imported
 from app.core.config import Config
-from app.gui.subscriptions_widget import SubscriptionsWidget  # new import
 
 logger = logging.getLogger(__name__)
 
+# "1920x1080" (also "1920*1080" / "1920×1080"), "1920x", "x1080" or a bare height like "1080"
+# (input is lower-cased, no spaces)
+_RES_RE = re.compile(r"^(?:(\d*)[x*×](\d*)|(\d+))$")
+
+def parse_resolution(spec: str):
+    """Parse a user resolution spec into (width, height); unknown parts are None. Shared by all forms."""
+    if not spec:
+        return None, None
+    return _parse_resolution_cached(spec.lower().strip().replace(" ", ""))
+
+@functools.lru_cache(maxsize=8)
+def _parse_resolution_cached(spec: str):
+    """Parse a normalized resolution spec into (width, height); unknown parts are None."""
+    m = _RES_RE.match(spec)
+    if not m:
+        return None, None
+    if m.group(3):
+        return None, int(m.group(3))
+    w = int(m.group(1)) if m.group(1) else None
+    h = int(m.group(2)) if m.group(2) else None
+    if not (w or h):
+        return None, None
+    return w, h
+
+# Resolved once at import; the runtime location cannot change within a process
+if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+    _BASE_DIR = Path(getattr(sys, "_MEIPASS", ""))
+else:
+    _BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
 def get_runtime_base_dir() -> Path:
     """
     Returns the base directory both in dev and when frozen by PyInstaller.
     """
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        return Path(getattr(sys, "_MEIPASS", ""))
-    return Path(__file__).resolve().parent.parent.parent
+    return _BASE_DIR
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Indexed by task_type_combo.currentIndex()
+    _TASK_TYPES = (TaskType.VIDEO_AUDIO, TaskType.AUDIO_ONLY, TaskType.VIDEO_ONLY)
+    # Stored as item data so the same str objects are handed out on every read
+    _OUTPUT_FORMATS = ("mp4", "mov", "mkv", "avi")
+    
     def __init__(self):
         super().__init__()
+        self._ffmpeg_path = None  # resolved lazily on first download (False = not found)
+        # One reusable failure popup; failures arriving close together are shown at once
+        self._pending_failures = {}  # task_id -> popup text, waiting for the next flush
+        self._shown_failures = {}  # task_id -> popup text, currently in the popup
+        self._fail_box = QMessageBox(self)
+        self._fail_box.setIcon(QMessageBox.Icon.Warning)
+        self._fail_box.setWindowTitle("Download Failed")
+        self._fail_box.setModal(False)
+        self._fail_box.finished.connect(lambda _result: self._shown_failures.clear())
         self.download_service = DownloadService()
+        # Direct: the task object is shared and mutated between emits, so it must be read at emit time
         self.download_service.task_updated.connect(self._on_task_updated)
         # NEW: update status bar when a task is added (captures user-chosen folder)
-        self.download_service.task_added.connect(self._on_task_added)
+        self.download_service.task_added.connect(self._on_task_added, Qt.ConnectionType.QueuedConnection)
         self.init_ui()
     
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("YouTube Manager")
-        self.setGeometry(100, 100, Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
+        self.setGeometry(100, 100, Config.instance().WINDOW_WIDTH, Config.instance().WINDOW_HEIGHT)
         
         tabs = QTabWidget()
         
@@ -50,22 +94,26 @@ class MainWindow(QMainWindow):
         d_layout.addLayout(url_layout)
         
         # Options section
-        options_layout = self.create_options_section()
-        d_layout.addLayout(options_layout)
+        d_layout.addLayout(self.create_options_section())
         
         # Download list
         self.download_list = DownloadListWidget(self.download_service)
         d_layout.addWidget(self.download_list)
         
         
-        # Subscriptions tab
-        self.subscriptions_widget = SubscriptionsWidget(
-            download_service=self.download_service,
-            options_provider=self.get_current_download_options
-        )
+        # Subscriptions tab (built on first show, see _ensure_subscriptions_widget)
+        self.subscriptions_widget = None
+        self._subs_tab = QWidget()
+        self._subs_tab_layout = QVBoxLayout(self._subs_tab)
+        self._subs_tab_layout.setContentsMargins(0, 0, 0, 0)
         
-        tabs.addTab(self.subscriptions_widget, "Subscriptions")
+        tabs.addTab(self._subs_tab, "Subscriptions")
         tabs.addTab(download_tab, "Downloader")
+        self.tabs = tabs
+        tabs.currentChanged.connect(self._on_tab_changed)
+        if tabs.currentWidget() is self._subs_tab:
+            # Visible at startup: build after the window has painted instead of before
+            QTimer.singleShot(0, self._ensure_subscriptions_widget)
         # Set central
         central_widget = QWidget()
         main_layout = QVBoxLayout(central_widget)
@@ -80,10 +128,27 @@ class MainWindow(QMainWindow):
         # Show download directory once for clarity (removed inner import that caused UnboundLocalError)
         try:
             # replaced fixed path line with helper
-            self._set_download_folder_status(Config.DOWNLOADS_DIR)
+            self._set_download_folder_status(Config.instance().DOWNLOADS_DIR)
         except Exception:
             pass
         
+    def _on_tab_changed(self, index: int):
+        if self.tabs.widget(index) is self._subs_tab:
+            self._ensure_subscriptions_widget()
+    
+    def _ensure_subscriptions_widget(self):
+        """Create the Subscriptions UI (and import its Google API deps) the first time it is shown."""
+        if self.subscriptions_widget is not None:
+            return
+        from app.gui.subscriptions_widget import SubscriptionsWidget
+        self.subscriptions_widget = SubscriptionsWidget(
+            download_service=self.download_service,
+            options_provider=self.get_current_download_options
+        )
+        self._subs_tab_layout.addWidget(self.subscriptions_widget)
+        # Built for good; later tab switches need no check
+        self.tabs.currentChanged.disconnect(self._on_tab_changed)
+    
     def create_url_input_section(self) -> QHBoxLayout:
         """Create URL input section."""
         layout = QHBoxLayout()
@@ -99,7 +164,7 @@ class MainWindow(QMainWindow):
         
         return layout
     
-    def create_options_section(self) -> QHBoxLayout:
+    def create_options_section(self) -> QVBoxLayout:
         """Create options section."""
         main_layout = QVBoxLayout()
         
@@ -115,7 +180,8 @@ class MainWindow(QMainWindow):
         # Output format
         layout.addWidget(QLabel("Format:"))
         self.format_combo = QComboBox()
-        self.format_combo.addItems(["mp4", "mov", "mkv", "avi"])
+        for fmt in self._OUTPUT_FORMATS:
+            self.format_combo.addItem(fmt, fmt)
         layout.addWidget(self.format_combo)
         
         # Resolution selector
@@ -196,7 +262,7 @@ class MainWindow(QMainWindow):
         folder_row.addWidget(QLabel("Download folder:"))
         self.download_dir_input = QLineEdit()
         self.download_dir_input.setPlaceholderText("Select folder...")
-        default_folder = QSettings().value("last_download_dir", str(Config.DOWNLOADS_DIR))
+        default_folder = QSettings().value("last_download_dir", str(Config.instance().DOWNLOADS_DIR))
         self.download_dir_input.setText(default_folder)
         self.download_dir_input.setMinimumWidth(320)
         browse_btn = QPushButton("Browse...")
@@ -213,32 +279,14 @@ class MainWindow(QMainWindow):
         folder_row.addStretch()
         main_layout.addLayout(folder_row)
 
-        # Convert to horizontal layout for return
-        container_widget = QWidget()
-        container_widget.setLayout(main_layout)
-        container_layout = QHBoxLayout()
-        container_layout.addWidget(container_widget)
-        
-        return container_layout
+        return main_layout
     
     def toggle_split_options(self, checked: bool):
         """Show/hide split options based on checkbox state."""
         self.split_options_widget.setVisible(checked)
     
     def _parse_resolution_spec(self, spec: str):
-        if not spec:
-            return None, None
-        spec = spec.lower().strip().replace(" ", "")
-        if "x" in spec:
-            a, b = spec.split("x", 1)
-            w = int(a) if a.isdigit() else None
-            h = int(b) if b.isdigit() else None
-            if not (w or h):
-                return None, None
-            return w, h
-        if spec.isdigit():
-            return None, int(spec)
-        return None, None
+        return parse_resolution(spec)
     
     def start_download(self):
         """Start a new download."""
@@ -247,7 +295,9 @@ class MainWindow(QMainWindow):
             return
         # Pre-check for ffmpeg (user feedback earlier than yt_dlp exception)
         if self.split_checkbox.isChecked() or self.task_type_combo.currentIndex() != 1:
-            if not shutil.which("ffmpeg"):
+            if self._ffmpeg_path is None:
+                self._ffmpeg_path = shutil.which("ffmpeg") or False
+            if not self._ffmpeg_path:
                 self.status_bar.showMessage("Warning: ffmpeg not found; download may fail.")
                 # Show popup only once per session
                 if not getattr(self, "_ffmpeg_warned", False):
@@ -260,20 +310,13 @@ class MainWindow(QMainWindow):
                     self._ffmpeg_warned = True
         
         # Duplicate prevention
-        for t in self.download_service.tasks.values():
-            if t.url == url and t.status not in (TaskStatus.FAILED, TaskStatus.CANCELLED, TaskStatus.COMPLETED):
-                self.status_bar.showMessage("Already downloading or queued.")
-                return
+        if self.download_service.is_url_active(url):
+            self.status_bar.showMessage("Already downloading or queued.")
+            return
         
         # Get selected options
-        task_type_map = {
-            0: TaskType.VIDEO_AUDIO,
-            1: TaskType.AUDIO_ONLY,
-            2: TaskType.VIDEO_ONLY
-        }
-        
-        task_type = task_type_map[self.task_type_combo.currentIndex()]
-        output_format = self.format_combo.currentText()
+        task_type = self._TASK_TYPES[self.task_type_combo.currentIndex()]
+        output_format = self.format_combo.currentData()
         should_split = self.split_checkbox.isChecked()
         
         # Get split options if enabled
@@ -311,7 +354,7 @@ class MainWindow(QMainWindow):
         w, h = self._parse_resolution_spec(self.resolution_input.text())
 
         # NEW: chosen download folder
-        chosen_dir = self.download_dir_input.text().strip() or str(Config.DOWNLOADS_DIR)
+        chosen_dir = self.download_dir_input.text().strip() or str(Config.instance().DOWNLOADS_DIR)
         QSettings().setValue("last_download_dir", chosen_dir)
 
         # Add download task
@@ -366,7 +409,7 @@ class MainWindow(QMainWindow):
             speed_factor = 1.0
         speed_factor = max(0.25, min(4.0, speed_factor))
         return {
-            "output_format": self.format_combo.currentText(),
+            "output_format": self.format_combo.currentData(),
             "should_split": self.split_checkbox.isChecked(),
             "segment_duration": segment_duration,
             "title_prefix": (self.title_prefix_input.text().strip() or "Part"),
@@ -381,15 +424,26 @@ class MainWindow(QMainWindow):
     def _on_task_updated(self, task):
         """Show detailed error info when a download fails."""
         if task.status == TaskStatus.FAILED:
+            # Each failed task is reported once, however many updates it still gets
+            if task.id in self._pending_failures or task.id in self._shown_failures:
+                return
             msg = task.error_message or "Unknown error"
             # Update status bar
             self.status_bar.showMessage(f"Download failed: {task.title or task.url} - {msg}")
-            # Popup for visibility
-            QMessageBox.warning(
-                self,
-                "Download Failed",
-                f"Title: {task.title or 'N/A'}\nURL: {task.url}\n\nError:\n{msg}"
-            )
+            # Popup for visibility (batched, see _flush_failures)
+            self._pending_failures[task.id] = f"Title: {task.title or 'N/A'}\nURL: {task.url}\n\nError:\n{msg}"
+            if len(self._pending_failures) == 1:
+                QTimer.singleShot(500, self._flush_failures)
+    
+    def _flush_failures(self):
+        """Show all failures collected since the last flush in the shared popup."""
+        if not self._pending_failures:
+            return
+        self._shown_failures.update(self._pending_failures)
+        self._pending_failures.clear()
+        self._fail_box.setText("\n\n---\n\n".join(self._shown_failures.values()))
+        self._fail_box.show()
+        self._fail_box.raise_()
     
     def _set_download_folder_status(self, path):
         """Helper to show current download folder."""
@@ -397,5 +451,5 @@ class MainWindow(QMainWindow):
 
     def _on_task_added(self, task):
         """Update status bar to reflect folder of newly added task."""
-        folder = getattr(task, "custom_download_dir", None) or Config.DOWNLOADS_DIR
+        folder = task.custom_download_dir or Config.instance().DOWNLOADS_DIR
         self._set_download_folder_status(folder)
@@ -1,15 +1,21 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QLabel,
-                             QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QHBoxLayout, QTableWidget, QTableWidgetItem, QTableView,
                              QSplitter, QAbstractItemView, QHeaderView, QSpinBox,
                              QDialog, QDialogButtonBox, QLineEdit, QCheckBox, QFormLayout,
                              QSizePolicy, QMessageBox, QFileDialog, QInputDialog,
-                             QDoubleSpinBox)  # + QDoubleSpinBox
-from PyQt6.QtCore import Qt, QSettings
+                             QDoubleSpinBox, QStyledItemDelegate, QStyle,
+                             QStyleOptionButton, QApplication)  # + QDoubleSpinBox
+from PyQt6.QtCore import (Qt, QSettings, QEvent, QSize, QTimer, pyqtSignal,
+                          QAbstractTableModel, QModelIndex, QSignalBlocker)
 import os
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from app.services.youtube_channel_service import YouTubeChannelService
-from app.models.download_task import TaskType, TaskStatus
+from app.models.download_task import TaskType, TaskStatus, TERMINAL_STATUSES
 from app.core.config import Config
+from app.gui.main_window import parse_resolution
 
 class SplitOptionsDialog(QDialog):
     """Dialog to collect per-download split options."""
@@ -18,41 +24,36 @@ class SplitOptionsDialog(QDialog):
         self.setWindowTitle("Download Options")
         self.setSizeGripEnabled(True)             # allow manual resize
         self.setMinimumWidth(520)                 # wider default
-        defaults = defaults or {}
+        self._initial_download_dir = initial_download_dir
         form = QFormLayout(self)
         form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
 
         self.split_checkbox = QCheckBox("Enable splitting")
-        self.split_checkbox.setChecked(defaults.get("should_split", True))
         form.addRow(self.split_checkbox)
 
         self.duration_spin = QSpinBox()
         self.duration_spin.setRange(10, 3600)
-        self.duration_spin.setValue(int(defaults.get("segment_duration", 120)))
         form.addRow("Segment duration (s):", self.duration_spin)
 
         self.title_prefix_edit = QLineEdit()
-        self.title_prefix_edit.setText(defaults.get("title_prefix", "Part"))
         self.title_prefix_edit.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         form.addRow("Title prefix:", self.title_prefix_edit)
 
         self.overlay_title_edit = QLineEdit()
-        self.overlay_title_edit.setText(video_title or defaults.get("overlay_title", video_title) or "")
         self.overlay_title_edit.setPlaceholderText("Overlay text shown at bottom of each split segment")
         self.overlay_title_edit.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         form.addRow("Overlay title:", self.overlay_title_edit)
 
+        self.burn_text_checkbox = QCheckBox("Burn title and part labels")
+        self.burn_text_checkbox.setToolTip(
+            "Unchecked at speed 1.0 the parts are cut without re-encoding (much faster; "
+            "cuts land on the nearest keyframe)"
+        )
+        form.addRow(self.burn_text_checkbox)
+
         # Resolution selector (new)
         self.resolution_edit = QLineEdit()
-        self.resolution_edit.setText(defaults.get("resolution", "1920x1080"))
         self.resolution_edit.setPlaceholderText("e.g. 1920x1080 or 1080")
-        if defaults:
-            rw = defaults.get("resolution_width")
-            rh = defaults.get("resolution_height")
-            if rw and rh:
-                self.resolution_edit.setText(f"{rw}x{rh}")
-            elif rh:
-                self.resolution_edit.setText(str(rh))
         form.addRow("Resolution:", self.resolution_edit)
 
         # New: Speed factor
@@ -60,7 +61,6 @@ class SplitOptionsDialog(QDialog):
         self.speed_spin.setDecimals(2)
         self.speed_spin.setRange(0.25, 4.0)
         self.speed_spin.setSingleStep(0.1)
-        self.speed_spin.setValue(float(defaults.get("speed_factor", 1.0)))
         self.speed_spin.setToolTip("Playback speed for split parts (video+audio). 1.0 = normal")
         form.addRow("Speed (x):", self.speed_spin)
 
@@ -68,14 +68,18 @@ class SplitOptionsDialog(QDialog):
         folder_layout = QHBoxLayout()
         self.folder_edit = QLineEdit()
         self.folder_edit.setPlaceholderText("Select download folder...")
-        if initial_download_dir:
-            self.folder_edit.setText(initial_download_dir)
         browse_btn = QPushButton("Browse...")
         def _browse():
-            start_dir = self.folder_edit.text().strip() or initial_download_dir or str(Path.home())
-            picked = QFileDialog.getExistingDirectory(self, "Select Download Folder", start_dir)
+            start_dir = self.folder_edit.text().strip() or self._initial_download_dir or str(Path.home())
+            # Qt's own dialog opens much faster than the native shell picker
+            picked = QFileDialog.getExistingDirectory(
+                self, "Select Download Folder", start_dir,
+                QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseNativeDialog
+            )
             if picked:
-                self.folder_edit.setText(picked)
+                picked = os.path.normpath(picked)
+                if picked != self.folder_edit.text():
+                    self.folder_edit.setText(picked)
         browse_btn.clicked.connect(_browse)
         folder_layout.addWidget(self.folder_edit)
         folder_layout.addWidget(browse_btn)
@@ -84,47 +88,65 @@ class SplitOptionsDialog(QDialog):
         # Add cut head/tail spinboxes
         self.cut_head_spin = QSpinBox()
         self.cut_head_spin.setRange(0, 3600)
-        self.cut_head_spin.setValue(int(defaults.get("cut_head_seconds", 0)))
         form.addRow("Cut head (s):", self.cut_head_spin)
 
         self.cut_tail_spin = QSpinBox()
         self.cut_tail_spin.setRange(0, 3600)
-        self.cut_tail_spin.setValue(int(defaults.get("cut_tail_seconds", 0)))
         form.addRow("Cut tail (s):", self.cut_tail_spin)
 
         # Enable/disable controls based on split checkbox
-        def toggle(enabled):
-            self.duration_spin.setEnabled(enabled)
-            self.title_prefix_edit.setEnabled(enabled)
-            self.overlay_title_edit.setEnabled(enabled)
-            # Resolution remains always enabled (no dependency)
-        self.split_checkbox.toggled.connect(toggle)
-        toggle(self.split_checkbox.isChecked())
+        self.split_checkbox.toggled.connect(self._toggle_split_fields)
 
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         form.addRow(buttons)
 
+        self.apply_defaults(defaults, video_title, initial_download_dir)
+
         # Adjust initial size after laying out
         self.resize(max(self.sizeHint().width() + 140, 520), self.sizeHint().height() + 20)
 
+    def _toggle_split_fields(self, enabled: bool):
+        self.duration_spin.setEnabled(enabled)
+        self.title_prefix_edit.setEnabled(enabled)
+        self.overlay_title_edit.setEnabled(enabled)
+        self.burn_text_checkbox.setEnabled(enabled)
+        # Resolution remains always enabled (no dependency)
+
+    def apply_defaults(self, defaults=None, video_title: str = "", initial_download_dir: str | None = None):
+        """Reset every field for a new video so one dialog instance can be reused."""
+        defaults = defaults or {}
+        self._initial_download_dir = initial_download_dir
+        self.split_checkbox.setChecked(defaults.get("should_split", True))
+        self.duration_spin.setValue(int(defaults.get("segment_duration", 120)))
+        self.title_prefix_edit.setText(defaults.get("title_prefix", "Part"))
+        self.overlay_title_edit.setText(video_title or defaults.get("overlay_title", video_title) or "")
+        self.burn_text_checkbox.setChecked(defaults.get("burn_text", True))
+        self.resolution_edit.setText(defaults.get("resolution", "1920x1080"))
+        if defaults:
+            rw = defaults.get("resolution_width")
+            rh = defaults.get("resolution_height")
+            if rw and rh:
+                self.resolution_edit.setText(f"{rw}x{rh}")
+            elif rh:
+                self.resolution_edit.setText(str(rh))
+        self.speed_spin.setValue(float(defaults.get("speed_factor", 1.0)))
+        self.folder_edit.setText(initial_download_dir or "")
+        self.cut_head_spin.setValue(int(defaults.get("cut_head_seconds", 0)))
+        self.cut_tail_spin.setValue(int(defaults.get("cut_tail_seconds", 0)))
+        self._toggle_split_fields(self.split_checkbox.isChecked())
+
     def get_values(self):
         vals = {
             "should_split": self.split_checkbox.isChecked(),
             "segment_duration": self.duration_spin.value(),
             "title_prefix": self.title_prefix_edit.text().strip() or "Part",
-            "overlay_title": self.overlay_title_edit.text().strip()
+            "overlay_title": self.overlay_title_edit.text().strip(),
+            "burn_text": self.burn_text_checkbox.isChecked()
         }
-        # Resolution parse
-        spec = self.resolution_edit.text().strip().lower().replace(" ", "")
-        rw = rh = None
-        if "x" in spec:
-            a, b = spec.split("x", 1)
-            if a.isdigit(): rw = int(a)
-            if b.isdigit(): rh = int(b)
-        elif spec.isdigit():
-            rh = int(spec)
+        # Resolution parse (same rules as the main tab)
+        rw, rh = parse_resolution(self.resolution_edit.text())
         vals["resolution_width"] = rw
         vals["resolution_height"] = rh
         vals["download_dir"] = self.folder_edit.text().strip()
@@ -133,20 +155,166 @@ class SplitOptionsDialog(QDialog):
         vals["speed_factor"] = float(self.speed_spin.value())
         return vals
 
+_SETTINGS: QSettings | None = None
+
+def _settings() -> QSettings:
+    """Shared QSettings for this module, opened on first use (after QApplication exists)."""
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = QSettings()
+    return _SETTINGS
+
+_by_pub_ts = itemgetter("_pub_ts")
+
+def _add_sort_keys(videos: list):
+    """Store each video's publish time as integer epoch seconds (_pub_ts) for sorting."""
+    for v in videos:
+        if "_pub_ts" in v:
+            continue
+        try:
+            v["_pub_ts"] = int(datetime.fromisoformat(v["published_at"].replace("Z", "+00:00")).timestamp())
+        except (KeyError, ValueError):
+            v["_pub_ts"] = 0
+
+def _downloading_tip(task) -> str:
+    tip = f"Downloading... {task.progress:.1f}%"
+    if task.download_speed:
+        tip += f" @ {task.download_speed}"
+    if task.eta:
+        tip += f" (ETA {task.eta})"
+    return tip
+
+# Download cell per task status: (text(task), enabled, tooltip(task))
+_IDLE_UI = (lambda t: "Download", True, lambda t: "Start download")
+_STATUS_UI = {
+    TaskStatus.QUEUED: (lambda t: "Queued", False, lambda t: "Queued for download"),
+    TaskStatus.DOWNLOADING: (lambda t: f"{int(t.progress)}%", False, _downloading_tip),
+    TaskStatus.PROCESSING: (lambda t: "Processing", False, lambda t: "Post-processing (splitting / marking)"),
+    TaskStatus.COMPLETED: (lambda t: "Done", False, lambda t: "Download completed"),
+    TaskStatus.FAILED: (lambda t: "Retry", True, lambda t: t.error_message or "Failed"),
+    TaskStatus.CANCELLED: (lambda t: "Cancelled", True, lambda t: "Cancelled"),
+}
+
+# Action cell data: DisplayRole holds the button text, this role whether it is clickable
+_ENABLED_ROLE = Qt.ItemDataRole.UserRole
+
+class VideosModel(QAbstractTableModel):
+    """Table model over the displayed videos; the last column is the Download action."""
+
+    HEADERS = ("Published", "Channel", "Title", "URL", "")
+    _KEYS = ("published_at", "_channel_title", "title", "url")
+    ACTION_COLUMN = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._videos = []
+        self._rows = {}  # url -> row
+        self._actions = []  # row -> (text, enabled, tooltip) of the Download cell
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._videos)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == self.ACTION_COLUMN:
+            text, enabled, tip = self._actions[row]
+            if role == Qt.ItemDataRole.DisplayRole:
+                return text
+            if role == _ENABLED_ROLE:
+                return enabled
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return tip
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._videos[row].get(self._KEYS[col], "")
+        return None
+
+    def video(self, row: int) -> dict:
+        return self._videos[row]
+
+    def set_videos(self, videos: list, actions: list):
+        """Replace all rows; actions holds the Download cell state for each video."""
+        self.beginResetModel()
+        self._videos = videos
+        self._rows = {v["url"]: r for r, v in enumerate(videos)}
+        self._actions = actions
+        self.endResetModel()
+
+    def set_action(self, url: str, action: tuple):
+        """Update the Download cell of url's row, repainting only if it changed."""
+        row = self._rows.get(url)
+        if row is None or self._actions[row] == action:
+            return
+        self._actions[row] = action
+        index = self.index(row, self.ACTION_COLUMN)
+        self.dataChanged.emit(index, index)
+
+class DownloadButtonDelegate(QStyledItemDelegate):
+    """Paints the Download column as push buttons without creating a widget per row."""
+
+    clicked = pyqtSignal(int)  # row
+
+    def _button_option(self, option, index) -> QStyleOptionButton:
+        btn = QStyleOptionButton()
+        btn.rect = option.rect.adjusted(2, 2, -2, -2)
+        btn.text = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        btn.state = QStyle.StateFlag.State_Raised
+        if index.data(_ENABLED_ROLE):
+            btn.state |= QStyle.StateFlag.State_Enabled
+        return btn
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, self._button_option(option, index), painter, widget)
+
+    def sizeHint(self, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        btn = self._button_option(option, index)
+        text_size = option.fontMetrics.size(0, btn.text or "Download")
+        return style.sizeFromContents(QStyle.ContentsType.CT_PushButton, btn, text_size, widget).expandedTo(QSize(90, 0))
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            if index.data(_ENABLED_ROLE) and option.rect.contains(event.position().toPoint()):
+                self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
 class SubscriptionsWidget(QWidget):
+    # Progress ticks arrive several times a second per task; refresh buttons at most this often
+    TASK_UPDATE_INTERVAL_MS = 150
+
     def __init__(self, parent=None, download_service=None, options_provider=None):
         super().__init__(parent)
         self.svc = YouTubeChannelService()
         self.download_service = download_service
         self.options_provider = options_provider
         self._subs = []
+        self._channel_title_by_id = {}  # rebuilt in _on_subs_loaded
         self._videos = {}          # per-channel
         self._all_videos = []      # aggregated list
         self._all_mode = False
         self._pending_channels = 0
         self._processed_channels = 0
-        self._download_buttons = {}  # url -> QPushButton
-        self._last_download_dir = QSettings().value("last_download_dir", str(getattr(Config, "DOWNLOADS_DIR", Path.home())))
+        self._dirty_tasks = {}  # url -> latest task, applied on the next flush
+        self._task_flush_timer = QTimer(self)
+        self._task_flush_timer.setSingleShot(True)
+        self._task_flush_timer.setInterval(self.TASK_UPDATE_INTERVAL_MS)
+        self._task_flush_timer.timeout.connect(self._flush_task_updates)
+        self._split_dialog = None  # created on first download, then reused
+        self._last_download_dir = _settings().value("last_download_dir", str(getattr(Config.instance(), "DOWNLOADS_DIR", Path.home())))
         self._build_ui()
         self._wire()
 
@@ -198,8 +366,9 @@ class SubscriptionsWidget(QWidget):
             header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
 
         # Videos table now 5 columns: Published, Channel, Title, URL, Action
-        self.videos_table = QTableWidget(0, 5)
-        self.videos_table.setHorizontalHeaderLabels(["Published", "Channel", "Title", "URL", ""])
+        self.videos_model = VideosModel(self)
+        self.videos_table = QTableView()
+        self.videos_table.setModel(self.videos_model)
         self.videos_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         header = self.videos_table.horizontalHeader()
         if header is not None:
@@ -208,6 +377,8 @@ class SubscriptionsWidget(QWidget):
             header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
             header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
             header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self._button_delegate = DownloadButtonDelegate(self.videos_table)
+        self.videos_table.setItemDelegateForColumn(VideosModel.ACTION_COLUMN, self._button_delegate)
 
         splitter.addWidget(self.subs_table)
         splitter.addWidget(self.videos_table)
@@ -224,6 +395,7 @@ class SubscriptionsWidget(QWidget):
         self.refresh_videos_btn.clicked.connect(self._load_selected_channel_videos)
         self.subs_table.itemSelectionChanged.connect(self._on_channel_selected)
         self.load_all_btn.clicked.connect(self._load_all_channels_videos)
+        self._button_delegate.clicked.connect(lambda row: self._download_video(self.videos_model.video(row)))
 
         self.svc.auth_changed.connect(self._on_auth_changed)
         self.svc.subscriptions_loaded.connect(self._on_subs_loaded)
@@ -233,12 +405,9 @@ class SubscriptionsWidget(QWidget):
         self.svc.quota_exceeded.connect(self._on_quota_exceeded)
         if self.download_service:
             self.download_service.task_updated.connect(self._on_task_update)
-        # NEW: attempt silent authentication reuse
-        if self.svc.ensure_session():
-            # Automatically load subscriptions after silent auth
-            self.refresh_subs_btn.setEnabled(True)
-            self.load_all_btn.setEnabled(True)
-            self._load_subs()
+        # NEW: attempt silent authentication reuse off the GUI thread;
+        # _on_auth_changed enables the buttons and loads subscriptions on success
+        self.svc.ensure_session_async()
 
     def _on_auth_clicked(self):
         """Handle authenticate button click."""
@@ -264,11 +433,20 @@ class SubscriptionsWidget(QWidget):
 
     def _on_subs_loaded(self, subs: list):
         self._subs = subs
-        self.subs_table.setRowCount(0)
-        for row, ch in enumerate(subs):
-            self.subs_table.insertRow(row)
-            self.subs_table.setItem(row, 0, QTableWidgetItem(ch["title"]))
-            self.subs_table.setItem(row, 1, QTableWidgetItem(ch["channel_id"]))
+        self._channel_title_by_id = {c["channel_id"]: c["title"] for c in subs}
+        # Fill with repaints and table signals suspended so the table lays out once
+        # and selection handlers do not run mid-build
+        self.subs_table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.subs_table):
+                self.subs_table.setRowCount(0)
+                self.subs_table.setRowCount(len(subs))
+                for row, ch in enumerate(subs):
+                    self.subs_table.setItem(row, 0, QTableWidgetItem(ch["title"]))
+                    self.subs_table.setItem(row, 1, QTableWidgetItem(ch["channel_id"]))
+        finally:
+            self.subs_table.setUpdatesEnabled(True)
+        self._on_channel_selected()  # selection was cleared while signals were blocked
         self.load_all_btn.setEnabled(bool(subs))
         self.status_label.setText(f"Loaded {len(subs)} subscriptions")
 
@@ -299,19 +477,11 @@ class SubscriptionsWidget(QWidget):
     def _load_all_channels_videos(self):
         if not self._subs:
             return
-        channel_ids = [c["channel_id"] for c in self._subs]
         limit = self.channel_limit.value() or None
-        effective_ids = channel_ids[:limit] if limit else channel_ids
+        effective_ids = [c["channel_id"] for c in islice(self._subs, limit)]
         use_search = not self.low_quota_checkbox.isChecked()
         # Quota estimate
-        try:
-            # Estimate quota units locally since import failed
-            def estimate_quota_units(channel_count, use_search):
-                # Example logic: search uses 100 units/channel, playlist uses 2 units/channel
-                return channel_count * (100 if use_search else 2)
-            estimated = estimate_quota_units(len(effective_ids), use_search)
-        except Exception:
-            estimated = None
+        estimated = self.svc.estimate_quota_units(len(effective_ids), use_search)
         if estimated:
             self.status_label.setText(f"Estimated quota cost: {estimated} unit(s). Starting fetch...")
             # Ask confirmation if high
@@ -346,103 +516,63 @@ class SubscriptionsWidget(QWidget):
         if self._all_mode:
             return
         # Obtain channel title
-        title_lookup = next((c["title"] for c in self._subs if c["channel_id"] == channel_id), channel_id)
+        title_lookup = self._channel_title_by_id.get(channel_id, channel_id)
         for v in videos:
             v["_channel_title"] = title_lookup
+        _add_sort_keys(videos)
         self._display_videos(videos, aggregated=False)
 
     def _on_all_videos_loaded(self, videos: list):
         # finalize aggregated load
+        title_lookup = self._channel_title_by_id
         for v in videos:
-            title_lookup = next((c["title"] for c in self._subs if c["channel_id"] == v.get("_channel_id")), v.get("_channel_id"))
-            v["_channel_title"] = title_lookup
+            v["_channel_title"] = title_lookup.get(v.get("_channel_id"), v.get("_channel_id"))
+        _add_sort_keys(videos)
         self._all_mode = False
         self._display_videos(videos, aggregated=True)
 
     def _display_videos(self, videos: list, aggregated: bool):
         # Sort by published desc
-        videos_sorted = sorted(videos, key=lambda x: x["published_at"], reverse=True)
-        self.videos_table.setRowCount(0)
-        self._download_buttons.clear()
-        for r, v in enumerate(videos_sorted):
-            self.videos_table.insertRow(r)
-            self.videos_table.setItem(r, 0, QTableWidgetItem(v["published_at"]))
-            self.videos_table.setItem(r, 1, QTableWidgetItem(v.get("_channel_title", "")))
-            self.videos_table.setItem(r, 2, QTableWidgetItem(v["title"]))
-            self.videos_table.setItem(r, 3, QTableWidgetItem(v["url"]))
-            btn = QPushButton("Download")
-            self._download_buttons[v["url"]] = btn
-            # If already tracked by a task, adjust state later
-            existing_task = self._find_task_by_url(v["url"])
-            if existing_task:
-                self._apply_task_state_to_button(existing_task, btn)
-            btn.clicked.connect(lambda _=False, video=v: self._download_video(video))
-            self.videos_table.setCellWidget(r, 4, btn)
+        videos_sorted = sorted(videos, key=_by_pub_ts, reverse=True)
+        # One model reset; cells are read from the video dicts when painted.
+        # Videos already tracked by a task show that task's state.
+        actions = [self._task_action(self._find_task_by_url(v["url"])) for v in videos_sorted]
+        self.videos_model.set_videos(videos_sorted, actions)
         self.status_label.setText(f"{len(videos_sorted)} video(s) shown{' (all channels)' if aggregated else ''}")
 
     def _find_task_by_url(self, url: str):
-        # Access download_service tasks
         if not self.download_service:
             return None
-        for t in self.download_service.tasks.values():
-            if t.url == url:
-                return t
-        return None
+        return self.download_service.find_task_by_url(url)
 
-    def _apply_task_state_to_button(self, task, btn):
-        # Preserve existing logic; add tooltip for errors and progress
-        if task.status == TaskStatus.QUEUED:
-            btn.setText("Queued")
-            btn.setEnabled(False)
-            btn.setToolTip("Queued for download")
-        elif task.status == TaskStatus.DOWNLOADING:
-            btn.setText(f"{int(task.progress)}%")
-            btn.setEnabled(False)
-            tip = f"Downloading... {task.progress:.1f}%"
-            if task.download_speed:
-                tip += f" @ {task.download_speed}"
-            if task.eta:
-                tip += f" (ETA {task.eta})"
-            btn.setToolTip(tip)
-        elif task.status == TaskStatus.PROCESSING:
-            btn.setText("Processing")
-            btn.setEnabled(False)
-            btn.setToolTip("Post-processing (splitting / marking)")
-        elif task.status == TaskStatus.COMPLETED:
-            btn.setText("Done")
-            btn.setEnabled(False)
-            btn.setToolTip("Download completed")
-        elif task.status == TaskStatus.FAILED:
-            btn.setText("Retry")
-            btn.setEnabled(True)
-            btn.setToolTip(task.error_message or "Failed")
-        elif task.status == TaskStatus.CANCELLED:
-            btn.setText("Cancelled")
-            btn.setEnabled(True)
-            btn.setToolTip("Cancelled")
-        else:
-            btn.setText("Download")
-            btn.setEnabled(True)
-            btn.setToolTip("Start download")
+    @staticmethod
+    def _task_action(task) -> tuple:
+        """(text, enabled, tooltip) of the Download cell for task (None = not downloaded yet)."""
+        text, enabled, tip = _STATUS_UI.get(task.status, _IDLE_UI) if task is not None else _IDLE_UI
+        return text(task), enabled, tip(task)
 
     def _download_video(self, video: dict):
         if not self.download_service:
             self.status_label.setText("Error: download service not available.")
             return
         existing = self._find_task_by_url(video["url"])
-        if existing and existing.status not in (TaskStatus.FAILED, TaskStatus.CANCELLED, TaskStatus.COMPLETED):
+        if existing and existing.status not in TERMINAL_STATUSES:
             self.status_label.setText("Already downloading / queued.")
             return
 
         # Base defaults from main window options provider (if available)
         opts = self.options_provider() if callable(self.options_provider) else {}
         base_opts = opts if isinstance(opts, dict) else {}
-        dlg = SplitOptionsDialog(
-            self,
-            defaults=base_opts,
-            video_title=video.get("title", ""),
-            initial_download_dir=self._last_download_dir
-        )
+        if self._split_dialog is None:
+            self._split_dialog = SplitOptionsDialog(
+                self,
+                defaults=base_opts,
+                video_title=video.get("title", ""),
+                initial_download_dir=self._last_download_dir
+            )
+        else:
+            self._split_dialog.apply_defaults(base_opts, video.get("title", ""), self._last_download_dir)
+        dlg = self._split_dialog
 
         if dlg.exec() != QDialog.DialogCode.Accepted:
             self.status_label.setText("Download cancelled.")
@@ -458,7 +588,7 @@ class SubscriptionsWidget(QWidget):
             QMessageBox.warning(self, "Folder Error", f"Cannot create/use folder:\n{folder}\n\n{e}")
             return
         self._last_download_dir = folder
-        QSettings().setValue("last_download_dir", folder)
+        _settings().setValue("last_download_dir", folder)
 
         task = self.download_service.add_download_task(
             url=video["url"],
@@ -473,22 +603,26 @@ class SubscriptionsWidget(QWidget):
             download_dir=folder,
             cut_head_seconds=user_opts.get("cut_head_seconds", 0),
             cut_tail_seconds=user_opts.get("cut_tail_seconds", 0),
-            speed_factor=user_opts.get("speed_factor", 1.0)
+            speed_factor=user_opts.get("speed_factor", 1.0),
+            burn_text=user_opts.get("burn_text", True)
         )
         self.download_service.start_download(task.id)
-        btn = self._download_buttons.get(video["url"])
-        if btn:
-            self._apply_task_state_to_button(task, btn)
+        self.videos_model.set_action(video["url"], self._task_action(task))
         self.status_label.setText(f"Queued/Started: {video['title']}")
 
     # Connect to download service to reflect progress
     def _on_task_update(self, task):
-        btn = self._download_buttons.get(task.url)
-        if btn:
-            self._apply_task_state_to_button(task, btn)
-        # Show error in status label immediately
-        if task.status == TaskStatus.FAILED:
-            self.status_label.setText(f"Error: {task.error_message or 'Unknown error'}")
+        self._dirty_tasks[task.url] = task
+        if not self._task_flush_timer.isActive():
+            self._task_flush_timer.start()
+
+    def _flush_task_updates(self):
+        dirty, self._dirty_tasks = self._dirty_tasks, {}
+        for url, task in dirty.items():
+            self.videos_model.set_action(url, self._task_action(task))
+            # Show error in status label
+            if task.status == TaskStatus.FAILED:
+                self.status_label.setText(f"Error: {task.error_message or 'Unknown error'}")
 
     # Added missing method referenced by signal connection
     def _on_error(self, msg: str):
@@ -496,16 +630,13 @@ class SubscriptionsWidget(QWidget):
             self.status_label.setText(f"Error: {msg}")
         else:
             print(f"Error: {msg}")
-        if hasattr(self, "status_label"):
-            self.status_label.setText(f"Error: {msg}")
-        else:
-            print(f"Error: {msg}")
 
     def _on_quota_exceeded(self, message: str, partial_videos: list):
         # Display partial videos (if any) and show message
+        title_lookup = self._channel_title_by_id
         for v in partial_videos:
-            title_lookup = next((c["title"] for c in self._subs if c["channel_id"] == v.get("_channel_id")), v.get("_channel_id"))
-            v["_channel_title"] = title_lookup
+            v["_channel_title"] = title_lookup.get(v.get("_channel_id"), v.get("_channel_id"))
+        _add_sort_keys(partial_videos)
         self._all_mode = False
         if partial_videos:
             self._display_videos(partial_videos, aggregated=True)
@@ -10,8 +10,8 @@ from app.core.logger import setup_logging
 def setup_application():
     """Initialize application configuration and logging."""
     # Ensure required directories exist
-    Config.DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
-    Config.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    Config.instance().DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
+    Config.instance().LOGS_DIR.mkdir(parents=True, exist_ok=True)
     
     # Setup logging
     setup_logging()
@@ -14,12 +14,15 @@ class TaskStatus(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+# Statuses after which a task will not change again (hot-path membership tests)
+TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
 class TaskType(Enum):
     VIDEO_AUDIO = "video_audio"
     AUDIO_ONLY = "audio_only"
     VIDEO_ONLY = "video_only"
 
-@dataclass
+@dataclass(slots=True)
 class DownloadTask:
     """Represents a download task."""
     
@@ -49,6 +52,10 @@ class DownloadTask:
     resolution_height: int | None = None
     # New: playback speed for split segments
     speed_factor: float = 1.0
+    # Draw title/part labels on split segments (False + speed 1.0 = stream copy)
+    burn_text: bool = True
     # Add cut head/tail fields
     cut_head_seconds: int = 0
     cut_tail_seconds: int = 0
+    # Target folder: "" = default downloads dir, None = waiting for the user to pick one
+    custom_download_dir: str | None = ""
@@ -1,38 +1,78 @@
+import copy
+import csv
+from collections import deque
+import functools
+import json
 import logging
 from pathlib import Path
 from typing import Callable, Optional
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread, Qt
 import yt_dlp
 import subprocess
-from app.models.download_task import DownloadTask, TaskStatus, TaskType
+from app.models.download_task import DownloadTask, TaskStatus, TaskType, TERMINAL_STATUSES
 from app.core.config import Config
 import os
 import shutil
 import sys  # ensure present
 import platform
 import textwrap
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
 import math
+import tempfile
 try:
     import psutil  # optional
 except Exception:
     psutil = None
+try:
+    from PIL import Image, ImageDraw, ImageFont  # optional: pre-rendered title overlay
+except Exception:
+    Image = None
 
-from yt_dlp.utils import DownloadError  # NEW
+from yt_dlp.utils import DownloadError, DownloadCancelled  # NEW
 
 logger = logging.getLogger(__name__)
 
 def get_video_duration(input_path):
-    """Get duration of a video file in seconds using ffprobe."""
+    """Get duration of a video file in seconds using ffprobe (cached while the file is unchanged)."""
+    duration = _probe_video(input_path)["duration"]
+    if duration is None:
+        raise ValueError(f"Could not read duration of {input_path}")
+    return duration
+
+def get_video_size(input_path) -> Optional[tuple[int, int]]:
+    """(width, height) of the first video stream, or None if it cannot be probed (cached like the duration)."""
+    return _probe_video(input_path)["size"]
+
+def _probe_video(input_path) -> dict:
+    st = os.stat(input_path)
+    return _probe_video_cached(str(input_path), st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=128)
+def _probe_video_cached(input_path: str, mtime_ns: int, size: int) -> dict:
+    # One ffprobe for everything the split needs: container duration + first video stream size
     cmd = [
         "ffprobe",
         "-v", "error",
-        "-show_entries", "format=duration",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(input_path)
+        "-threads", "1",
+        "-select_streams", "v:0",
+        "-show_entries", "format=duration:stream=width,height",
+        "-of", "json",
+        input_path
     ]
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    return float(result.stdout.strip())
+    # ffprobe's diagnostics are discarded at the source
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        data = json.loads(result.stdout or b"{}")
+    except ValueError:
+        data = {}
+    duration = (data.get("format") or {}).get("duration")
+    stream = (data.get("streams") or [{}])[0]
+    width, height = stream.get("width"), stream.get("height")
+    return {
+        "duration": float(duration) if duration else None,
+        "size": (int(width), int(height)) if width and height else None,
+    }
 
 def break_and_pad(text: str, width: int = 20) -> str:
     """
@@ -66,9 +106,13 @@ def _find_font_file() -> Optional[Path]:
       2. runtime_base_dir()/font/KeinannPOP.ttf (inside packaged app)
       3. runtime_base_dir()/resources/font/KeinannPOP.ttf
       4. Original absolute development path
+    The result is cached and only recomputed when YT_FONT_FILE changes.
     """
+    return _find_font_file_cached(os.environ.get("YT_FONT_FILE"))
+
+@functools.lru_cache(maxsize=4)
+def _find_font_file_cached(env_font: Optional[str]) -> Optional[Path]:
     candidates = []
-    env_font = os.environ.get("YT_FONT_FILE")
     if env_font:
         candidates.append(Path(env_font))
     base = _runtime_base_dir()
@@ -96,33 +140,245 @@ def _x_align_expr(align: str) -> str:
         return "w-text_w-60"
     return "(w-text_w)/2"
 
+# Single-pass translation tables for drawtext text and for paths inside filter options
+_DRAWTEXT_ESCAPES = str.maketrans({"\\": "\\\\", "'": " ", ":": " ", "%": "%%"})
+_FILTER_PATH_ESCAPES = str.maketrans({"\\": "\\\\", ":": "\\:"})
+
 def _escape_drawtext(text: str) -> str:
     """
     Escape a string for safe inclusion in ffmpeg drawtext's text='...'.
     Rules:
       - Backslash => \\\\
-      - Single quote => \'
-      - Colon => \:
+      - Single quote => space (cannot be escaped inside the quoted value)
+      - Colon => space
       - Percent => %%  (avoid strftime expansion)
-      - Newline chars => \n (literal sequence for multi-line)
+      - Newline chars => kept (drawtext renders them as line breaks)
     """
     if text is None:
         return ""
-    return (
-        text.replace("\\", "\\\\")
-            .replace("'", r" ")
-            .replace(":", r" ")
-            .replace("%", "%%")
+    return text.translate(_DRAWTEXT_ESCAPES)
+
+def _overlay_x_expr(align: str) -> str:
+    """Same placement as _x_align_expr, in overlay filter terms (W = frame, w = overlay)."""
+    a = (align or "center").lower()
+    if a == "left":
+        return "60"
+    if a == "right":
+        return "W-w-60"
+    return "(W-w)/2"
+
+@functools.lru_cache(maxsize=8)
+def _overlay_font(font_path: str, size: int):
+    return ImageFont.truetype(font_path, size)
+
+def _render_title_overlay(text: str, font_file: Optional[Path], size: int = 36,
+                          border: int = 10) -> Optional[Path]:
+    """
+    Render text once as black on a yellow box (the drawtext title look) into a temp PNG.
+    Returns None when Pillow or the font is unavailable, so callers fall back to drawtext.
+    """
+    if Image is None or not font_file:
+        return None
+    try:
+        font = _overlay_font(str(font_file), size)
+        probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        left, top, right, bottom = probe.multiline_textbbox((0, 0), text, font=font, align="center")
+        img = Image.new("RGBA", (right - left + 2 * border, bottom - top + 2 * border), (255, 255, 0, 255))
+        ImageDraw.Draw(img).multiline_text(
+            (border - left, border - top), text, font=font, fill=(0, 0, 0, 255), align="center"
+        )
+        fd, name = tempfile.mkstemp(suffix=".png", prefix="yt_title_")
+        os.close(fd)
+        img.save(name)
+        return Path(name)
+    except Exception as e:
+        logger.warning(f"Title overlay rendering failed, using drawtext: {e}")
+        return None
+
+@functools.lru_cache(maxsize=64)
+def _build_video_filter(w: int, h: int, safe_title: str, title_prefix: str, source_segment: float,
+                        speed_factor: float, title_align: str, part_align: str,
+                        font_file: Optional[str], title_overlay: bool, burn_text: bool = True,
+                        native_size: bool = False) -> str:
+    """
+    Video filter for split_and_mark_video; cached since batches reuse the same template.
+    With title_overlay the result is a -filter_complex graph that overlays input 1 (the
+    pre-rendered title) and ends in [v]; otherwise a plain -vf chain with a drawtext title.
+    Without burn_text only scaling and the speed change are applied.
+    native_size (source already w x h) drops the scale/pad stage.
+    """
+    # Escape backslashes and colons for ffmpeg drawtext parser
+    font_opt = f"fontfile='{font_file.translate(_FILTER_PATH_ESCAPES)}':" if font_file else ""
+    # "%{eif:floor(t/N)+1:d}" renders the 1-based part number of the current frame
+    part_label = f"{_escape_drawtext(title_prefix)} %{{eif\\:floor(t/{source_segment:.6f})+1\\:d}}"
+    scale_pad = "" if native_size else (
+        f"scale={w}:{h}:force_original_aspect_ratio=decrease,pad={w}:{h}:(ow-iw)/2:(oh-ih)/2"
+    )
+    part_filter = (
+        f"drawtext={font_opt}text='{part_label}':fontcolor=black:fontsize=48:"
+        f"x={_x_align_expr(part_align)}:y=h-text_h-h/4:box=1:boxcolor=yellow@1:boxborderw=10"
+    )
+    # New: adjust video PTS for speed
+    speed_filter = f"setpts=PTS/{speed_factor:.6f}" if speed_factor != 1.0 else ""
+    if not burn_text:
+        return ",".join(f for f in (scale_pad, speed_filter) if f) or "null"
+    if title_overlay:
+        base = f"[0:v]{scale_pad}[base];[base]" if scale_pad else "[0:v]"
+        # Box top sits border (10px) above the text top that drawtext would use (h/4 - text_h)
+        return (
+            f"{base}[1:v]overlay=x={_overlay_x_expr(title_align)}:y=H/4-h+10,"
+            + ",".join(f for f in (part_filter, speed_filter) if f) + "[v]"
+        )
+    title_filter = (
+        f"drawtext={font_opt}text='{safe_title}':fontcolor=black:fontsize=36:"
+        f"x={_x_align_expr(title_align)}:y=h/4-text_h:box=1:boxcolor=yellow@1:boxborderw=10"
     )
+    return ",".join(f for f in (scale_pad, title_filter, part_filter, speed_filter) if f)
+
+# Filter graphs longer than this are passed via -filter_complex_script (Windows caps a
+# command line at 32767 characters)
+_FILTER_ARG_MAX = 8000
+
+_H264_CONTAINERS = frozenset({".mp4", ".m4v", ".mov", ".mkv"})
+
+@functools.lru_cache(maxsize=1)
+def _hw_h264_encoder() -> Optional[str]:
+    """
+    Return a hardware H.264 encoder listed by `ffmpeg -encoders`, probed once per process.
+    Prefers h264_videotoolbox on macOS, h264_nvenc then h264_qsv elsewhere.
+    Set YT_HW_ENCODE=0 to always use libx264.
+    """
+    if os.environ.get("YT_HW_ENCODE", "1") == "0":
+        return None
+    try:
+        listing = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=15
+        ).stdout
+    except Exception:
+        return None
+    preferred = ("h264_videotoolbox",) if sys.platform == "darwin" else ("h264_nvenc", "h264_qsv")
+    available = {line.split()[1] for line in listing.splitlines() if len(line.split()) > 1}
+    return next((e for e in preferred if e in available), None)
+
+@functools.lru_cache(maxsize=1)
+def _hw_decode_args() -> tuple[str, ...]:
+    """
+    Input options for hardware decoding, probed once with `ffmpeg -hwaccels`.
+    '-hwaccel auto' without an output format hands decoded frames back in system
+    memory, so the CPU scale/pad/drawtext graph is unchanged, and ffmpeg falls back
+    to software decoding if the device cannot be initialised.
+    Set YT_HW_DECODE=0 to always decode in software.
+    """
+    if os.environ.get("YT_HW_DECODE", "1") == "0":
+        return ()
+    try:
+        listing = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=15
+        ).stdout
+    except Exception:
+        return ()
+    # First line is the "Hardware acceleration methods:" header
+    methods = [line.strip() for line in listing.splitlines()[1:] if line.strip()]
+    return ("-hwaccel", "auto") if methods else ()
+
+def _h264_args(encoder: str, preset: str, crf: int) -> list[str]:
+    """Video codec arguments for encoder at roughly libx264 `preset`/`crf` quality."""
+    if encoder == "h264_nvenc":
+        return ["-c:v", encoder, "-preset", "p4", "-rc", "vbr", "-cq", str(crf), "-b:v", "0", "-pix_fmt", "yuv420p"]
+    if encoder == "h264_qsv":
+        return ["-c:v", encoder, "-preset", preset, "-global_quality", str(crf), "-pix_fmt", "nv12"]
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", encoder, "-b:v", "8M", "-pix_fmt", "yuv420p"]
+    return ["-c:v", "libx264", "-preset", preset, "-crf", str(crf), "-pix_fmt", "yuv420p"]
+
+_split_limit = None
+_split_limit_lock = threading.Lock()
+
+def _split_job_limit() -> tuple[threading.BoundedSemaphore, int]:
+    """
+    Shared limit for split ffmpeg jobs across all download workers.
+    Returns (slots, threads_per_job): at most YT_SPLIT_WORKERS jobs run at once and
+    each gets an equal share of the cores (YT_FFMPEG_THREADS overrides, capped to 1..64).
+    Read on first use, after resource tuning set the env.
+    """
+    global _split_limit
+    with _split_limit_lock:
+        if _split_limit is None:
+            jobs = max(1, int(os.environ.get("YT_SPLIT_WORKERS", "4")))
+            threads = max(1, (os.cpu_count() or 2) // jobs)
+            env_threads = os.environ.get("YT_FFMPEG_THREADS")
+            if env_threads and env_threads.isdigit():
+                threads = max(1, min(int(env_threads), 64))
+            _split_limit = (threading.BoundedSemaphore(jobs), threads)
+        return _split_limit
+
+def _run_ffmpeg(cmd: list[str], should_cancel: Callable[[], bool] | None = None,
+                on_progress: Callable[[float, str], None] | None = None, total_seconds: float = 0.0):
+    """
+    Run ffmpeg like subprocess.run(cmd, check=True), but stoppable and reporting progress.
+    ffmpeg writes key=value progress blocks to stdout about twice a second; should_cancel
+    is polled per line (True terminates ffmpeg and raises DownloadCancelled) and
+    on_progress(percent, speed) is called per block when total_seconds is known.
+    Only errors are logged, into a temp file attached to CalledProcessError.stderr;
+    YT_FFMPEG_LOG=1 passes ffmpeg's full log through to the console instead.
+    """
+    verbose = os.environ.get("YT_FFMPEG_LOG") == "1"
+    # A file rather than a pipe: nothing has to drain it while stdout is being read
+    log = None if verbose else tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        cmd[:1] + ["-progress", "pipe:1", "-nostats"] + ([] if verbose else ["-loglevel", "error"]) + cmd[1:],
+        stdout=subprocess.PIPE, stderr=log, text=True
+    )
+    out_us, speed = 0, ""
+    try:
+        for line in proc.stdout:
+            if should_cancel and should_cancel():
+                proc.terminate()
+                raise DownloadCancelled("Splitting cancelled by user")
+            key, _, value = line.strip().partition("=")
+            if key == "out_time_us" and value.isdigit():
+                out_us = int(value)
+            elif key == "speed":
+                speed = value
+            elif key == "progress" and on_progress and total_seconds > 0:
+                on_progress(min(100.0, out_us / 1e4 / total_seconds), speed)
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+        errors = ""
+        if log:
+            log.seek(0)
+            errors = log.read()[-2000:].decode("utf-8", "replace").strip()
+            log.close()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=errors)
 
 def split_and_mark_video(input_path, outfolder="downloads", segment_duration=120,
                          title_prefix="Part", video_title=None, h=1920, w=1080,
                          title_align: str = "center", part_align: str = "center",
-                         speed_factor: float = 1.0):
-    """Split video into segments and overlay part label and title; optionally adjust playback speed."""
+                         speed_factor: float = 1.0, start_offset: float = 0.0,
+                         max_duration: float | None = None,
+                         preset: str = "veryfast", crf: int = 20,
+                         should_cancel: Callable[[], bool] | None = None,
+                         on_progress: Callable[[float, str], None] | None = None,
+                         burn_text: bool = True, duration: float | None = None,
+                         source_size: tuple[int, int] | None = None):
+    """
+    Split video into segments and overlay part label and title; optionally adjust playback speed.
+    Runs a single ffmpeg pass: the source is decoded, scaled and encoded once and the
+    segment muxer cuts the parts, while drawtext derives each part number from the timestamp.
+    start_offset/max_duration trim the source (seconds) as part of the same pass.
+    preset/crf tune the H.264 encode (libx264 scale; mapped for hardware encoders).
+    should_cancel/on_progress are passed to _run_ffmpeg; cancelling raises DownloadCancelled.
+    burn_text=False skips the labels; at normal speed the streams are then copied without
+    re-encoding, so parts start at the first keyframe after each boundary.
+    duration/source_size describe input_path when the caller already knows them (e.g. from
+    yt-dlp); ffprobe is only run for what is missing.
+    """
     outdir = Path(outfolder)
     outdir.mkdir(parents=True, exist_ok=True)
-    duration = get_video_duration(input_path)
     if video_title is None:
         # Derive from filename if not provided
         stem = input_path.stem
@@ -132,22 +388,6 @@ def split_and_mark_video(input_path, outfolder="downloads", segment_duration=120
 
     # Font file integration (prod-aware)
     font_file = _find_font_file()
-    font_param = ""
-    if font_file:
-        # Escape backslashes and colons for ffmpeg drawtext parser
-        escaped_font_path = str(font_file).replace("\\", "\\\\").replace(":", "\\:")
-        font_param = f"fontfile='{escaped_font_path}'"
-
-    num_parts = int(duration // segment_duration) + (1 if duration % segment_duration > 0 else 0)
-    segments = []
-
-    # Build task descriptors first
-    tasks = []
-    for i in range(num_parts):
-        start = i * segment_duration
-        out_file = outdir / f"{input_path.stem}_{title_prefix.lower().replace(' ', '_')}{i+1}{input_path.suffix}"
-        top_text = f"{title_prefix} {i+1}"
-        tasks.append((i, start, out_file, top_text))
 
     def _build_atempo_chain(speed: float) -> list[str]:
         # Build an atempo chain (each atempo must be between 0.5 and 2.0)
@@ -168,31 +408,60 @@ def split_and_mark_video(input_path, outfolder="downloads", segment_duration=120
             chain.append(f"atempo={factor:.6f}")
         return chain
 
-    def _run_segment(idx, start, out_file, top_text):
-        title_x = _x_align_expr(title_align)
-        part_x = _x_align_expr(part_align)
-        top_text_escaped = _escape_drawtext(top_text)
-        vf = (
-            f"scale={w}:{h}:force_original_aspect_ratio=decrease,pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,"
-            f"drawtext={font_param + ':' if font_param else ''}text='{safe_title}':fontcolor=black:fontsize=36:"
-            f"x={title_x}:y=h/4-text_h:box=1:boxcolor=yellow@1:boxborderw=10,"
-            f"drawtext={font_param + ':' if font_param else ''}text='{top_text_escaped}':fontcolor=black:fontsize=48:"
-            f"x={part_x}:y=h-text_h-h/4:box=1:boxcolor=yellow@1:boxborderw=10"
+    speed_changed = abs(speed_factor - 1.0) > 1e-3
+    # Parts are segment_duration long in output time; drawtext sees source time,
+    # which runs speed_factor times faster than the output
+    source_segment = segment_duration * (speed_factor if speed_changed else 1.0)
+
+    # Nothing to draw and no retiming: the muxer can cut the original streams as they are
+    stream_copy = not burn_text and not speed_changed
+    # Temp files (title PNG, filter script, segment list) are created inside the try so
+    # a failure anywhere below still removes them
+    title_png = filter_script = segment_list = None
+    try:
+        # The title never changes: rasterize it once and overlay the bitmap instead of
+        # having drawtext shape the glyphs on every frame
+        title_png = _render_title_overlay(safe_title_raw, font_file) if burn_text else None
+        video_filter = None if stream_copy else _build_video_filter(
+            w, h, safe_title, title_prefix, source_segment,
+            speed_factor if speed_changed else 1.0,
+            title_align, part_align, str(font_file) if font_file else None, bool(title_png), burn_text,
+            # A source already at the target size needs no scale/pad pass over every frame
+            (source_size or get_video_size(input_path)) == (w, h)
         )
-        # New: adjust video PTS for speed
-        if abs(speed_factor - 1.0) > 1e-3:
-            vf = f"{vf},setpts=PTS/{speed_factor:.6f}"
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", str(input_path),
-            "-ss", str(start),
-            "-t", str(segment_duration),
-            "-vf", vf,
-        ]
+
+        cmd = ["ffmpeg", "-y"]
+        # Input-side trim: -ss before -i seeks by keyframe index instead of decoding up to it
+        if start_offset > 0:
+            cmd += ["-ss", str(start_offset)]
+        if max_duration is not None:
+            cmd += ["-t", str(max_duration)]
+        if not stream_copy:
+            cmd += _hw_decode_args()
+        cmd += ["-i", str(input_path)]
+        if stream_copy:
+            cmd += ["-map", "0:v", "-map", "0:a?", "-c", "copy", "-avoid_negative_ts", "make_zero"]
+        else:
+            if title_png:
+                cmd += ["-i", str(title_png)]
+            graph = video_filter if title_png else f"[0:v]{video_filter}[v]"
+            if len(graph) > _FILTER_ARG_MAX:
+                # Very long graphs (long wrapped titles) go through a file instead of argv
+                fd, script_name = tempfile.mkstemp(suffix=".ffscript", prefix="yt_filter_")
+                filter_script = Path(script_name)
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(graph)
+                cmd += ["-filter_complex_script", script_name, "-map", "[v]", "-map", "0:a?"]
+            elif title_png:
+                cmd += ["-filter_complex", graph, "-map", "[v]", "-map", "0:a?"]
+            else:
+                cmd += ["-vf", video_filter]
+        if not stream_copy:
+            # Keyframe exactly on every part boundary so the muxer cuts precisely
+            cmd += ["-force_key_frames", f"expr:gte(t,n_forced*{segment_duration})"]
 
         # New: audio handling (copy if speed==1, else atempo chain + re-encode)
-        if abs(speed_factor - 1.0) <= 1e-3:
+        if not speed_changed:
             cmd += ["-c:a", "copy"]
         else:
             atempo_chain = _build_atempo_chain(speed_factor)
@@ -200,62 +469,95 @@ def split_and_mark_video(input_path, outfolder="downloads", segment_duration=120
                 cmd += ["-filter:a", ",".join(atempo_chain)]
             cmd += ["-c:a", "aac"]
 
-        cmd += [str(out_file)]
-        subprocess.run(cmd, check=True)
-        return idx, out_file
-
-    # Parallel execution
-    max_workers = min(
-        len(tasks),
-        max(1, int(os.environ.get("YT_SPLIT_WORKERS", "4")))
-    )
-    errors = []
-    results = {}
-    if tasks:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {
-                executor.submit(_run_segment, idx, start, out_file, top_text): idx
-                for (idx, start, out_file, top_text) in tasks
-            }
-            for fut in as_completed(future_map):
+        # Same names as before: <stem>_<prefix><n><suffix>, numbered from 1
+        name_prefix = f"{input_path.stem}_{title_prefix.lower().replace(' ', '_')}"
+        pattern = outdir / f"{name_prefix.replace('%', '%%')}%d{input_path.suffix}"
+        # ffmpeg records every part it writes (basename,start,end) in this list
+        fd, list_name = tempfile.mkstemp(suffix=".csv", prefix="yt_segments_")
+        os.close(fd)
+        segment_list = Path(list_name)
+        slots, threads = _split_job_limit()
+        output_args = [
+            "-threads", str(threads),
+            "-f", "segment",
+            "-segment_time", str(segment_duration),
+            "-segment_start_number", "1",
+            "-reset_timestamps", "1",
+            "-segment_list", str(segment_list),
+            "-segment_list_type", "csv",
+            str(pattern),
+        ]
+        # H.264 only where the container takes it; other containers keep ffmpeg's default codec
+        encoders = [None]
+        if not stream_copy and input_path.suffix.lower() in _H264_CONTAINERS:
+            encoders = [e for e in (_hw_h264_encoder(), "libx264") if e]
+        total_out = 0.0
+        if on_progress:
+            # Output length in seconds, for the percentage
+            total_out = max_duration
+            if total_out is None:
+                total_out = (duration or get_video_duration(input_path)) - start_offset
+            total_out /= speed_factor if speed_changed else 1.0
+        with slots:
+            for n, encoder in enumerate(encoders, 1):
+                video_args = _h264_args(encoder, preset, crf) if encoder else []
                 try:
-                    idx, produced = fut.result()
-                    results[idx] = produced
-                    print(f"Created {produced}")
-                except Exception as e:
-                    errors.append(e)
-        if errors:
-            # Optionally remove any partially created segments on failure
-            raise RuntimeError(
-                f"One or more segments failed ({len(errors)}/{len(tasks)}). First error: {errors[0]}"
-            )
-        # Preserve original order
-        segments = [results[i] for i in range(len(tasks))]
+                    _run_ffmpeg(cmd + video_args + output_args, should_cancel, on_progress, total_out)
+                    break
+                except subprocess.CalledProcessError as e:
+                    if n == len(encoders):
+                        raise
+                    # Listed hardware encoders can still fail (no device / driver); use libx264
+                    logger.warning(f"Encoder {encoder} failed, retrying split with libx264: {e.stderr}")
+        with segment_list.open(newline="", encoding="utf-8") as fh:
+            segments = [outdir / row[0] for row in csv.reader(fh) if row]
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Splitting failed: {e}\n{e.stderr or ''}".rstrip()) from e
+    finally:
+        if segment_list:
+            segment_list.unlink(missing_ok=True)
+        if filter_script:
+            filter_script.unlink(missing_ok=True)
+        if title_png:
+            title_png.unlink(missing_ok=True)
+
+    for out_file in segments:
+        print(f"Created {out_file}")
     return segments
 
+@functools.lru_cache(maxsize=1)
 def _runtime_base_dir():
     """Return base dir in dev or frozen mode."""
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         return Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent.parent))
     return Path(__file__).resolve().parent.parent.parent
 
-def _candidate_ffmpeg_paths():
+@functools.lru_cache(maxsize=1)
+def _candidate_ffmpeg_paths() -> tuple[Path, ...]:
     base = _runtime_base_dir()
+    # Only the layouts that can exist on this platform
+    if sys.platform == "win32":
+        return (
+            base / "ffmpeg.exe",
+            base / "ffprobe.exe",
+            base / "vendor" / "ffmpeg" / "windows" / "ffmpeg.exe",
+            base / "vendor" / "ffmpeg" / "windows" / "ffprobe.exe",
+        )
     # In a macOS .app the executable lives in .../Contents/MacOS
-    return [
+    candidates = [
         base / "ffmpeg",
         base / "ffprobe",
         base.parent / "ffmpeg",
         base.parent / "ffprobe",
         base.parent.parent / "ffmpeg",
         base.parent.parent / "ffprobe",
-        base / "ffmpeg.exe",
-        base / "ffprobe.exe",
-        base / "vendor" / "ffmpeg" / "macos" / "ffmpeg",
-        base / "vendor" / "ffmpeg" / "macos" / "ffprobe",
-        base / "vendor" / "ffmpeg" / "windows" / "ffmpeg.exe",
-        base / "vendor" / "ffmpeg" / "windows" / "ffprobe.exe",
     ]
+    if sys.platform == "darwin":
+        candidates += [
+            base / "vendor" / "ffmpeg" / "macos" / "ffmpeg",
+            base / "vendor" / "ffmpeg" / "macos" / "ffprobe",
+        ]
+    return tuple(candidates)
 
 def _locate_ffmpeg() -> tuple[Optional[str], Optional[str], Optional[str]]:
     """
@@ -265,7 +567,12 @@ def _locate_ffmpeg() -> tuple[Optional[str], Optional[str], Optional[str]]:
       2. Bundled binaries in runtime base dir
       3. vendor/ffmpeg subfolder (if packaged)
     Returns (ffmpeg_path, ffprobe_path, ffmpeg_dir)
+    The result is cached and only recomputed when PATH changes.
     """
+    return _locate_ffmpeg_cached(os.environ.get("PATH", ""))
+
+@functools.lru_cache(maxsize=4)
+def _locate_ffmpeg_cached(path_env: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
     # Try PATH first
     ffmpeg = shutil.which("ffmpeg")
     ffprobe = shutil.which("ffprobe")
@@ -275,7 +582,7 @@ def _locate_ffmpeg() -> tuple[Optional[str], Optional[str], Optional[str]]:
     found_ffmpeg = None
     found_ffprobe = None
     for p in _candidate_ffmpeg_paths():
-        if p.exists() and p.is_file():
+        if p.is_file():
             if "ffprobe" in p.name and not found_ffprobe:
                 found_ffprobe = str(p)
             elif "ffmpeg" in p.name and not found_ffmpeg:
@@ -291,10 +598,10 @@ def _ffmpeg_available():
 def _prepare_download_dir(path_like: str | Path | None) -> Path:
     """
     Resolve and ensure a custom download directory.
-    Falls back to Config.DOWNLOADS_DIR if invalid.
+    Falls back to Config.instance().DOWNLOADS_DIR if invalid.
     """
     if not path_like:
-        return Config.DOWNLOADS_DIR
+        return Config.instance().DOWNLOADS_DIR
     try:
         p = Path(path_like).expanduser()
         if not p.is_absolute():
@@ -306,10 +613,10 @@ def _prepare_download_dir(path_like: str | Path | None) -> Path:
             test_file.write_text("ok", encoding="utf-8")
             test_file.unlink(missing_ok=True)
         except Exception:
-            return Config.DOWNLOADS_DIR
+            return Config.instance().DOWNLOADS_DIR
         return p
     except Exception:
-        return Config.DOWNLOADS_DIR
+        return Config.instance().DOWNLOADS_DIR
 
 # ---------- NEW: yt-dlp fallback helper ----------
 # ---------- NEW: playable format selector helpers ----------
@@ -359,6 +666,75 @@ def _log_top_formats(info: dict, limit: int = 20):
         )
     logger.info("Available formats (first %d): %s", limit, ", ".join(snippet))
 
+@functools.lru_cache(maxsize=1)
+def _external_downloader_opts() -> dict:
+    """
+    yt-dlp options that hand plain HTTP downloads to aria2c (several connections per file).
+    Opt-in with YT_ARIA2C=1: aria2c reports progress less often and cancellation only takes
+    effect between files, so the native downloader stays the default.
+    """
+    if os.environ.get("YT_ARIA2C", "0") != "1":
+        return {}
+    if not shutil.which("aria2c"):
+        logger.warning("YT_ARIA2C=1 but aria2c was not found on PATH; using the native downloader")
+        return {}
+    return {
+        "external_downloader": {"http": "aria2c"},
+        "external_downloader_args": {"aria2c": ["-x", "8", "-s", "8", "-k", "1M"]},
+    }
+
+# Unprocessed extractor results by URL, reused across format fallbacks and repeat downloads.
+# Short TTL: the stream URLs inside them expire.
+_INFO_TTL_S = 300
+_INFO_CACHE_MAX = 64
+_info_cache: dict[str, tuple[float, dict]] = {}
+_info_cache_lock = threading.Lock()
+
+def _extract_raw_info(ydl, url: str) -> dict:
+    """Return the unprocessed extractor result for url, extracting only on a cache miss."""
+    now = time.monotonic()
+    with _info_cache_lock:
+        hit = _info_cache.get(url)
+    if hit and now - hit[0] < _INFO_TTL_S:
+        return hit[1]
+    raw = ydl.extract_info(url, download=False, process=False)
+    with _info_cache_lock:
+        _info_cache.pop(url, None)
+        _info_cache[url] = (now, raw)
+        while len(_info_cache) > _INFO_CACHE_MAX:
+            del _info_cache[next(iter(_info_cache))]  # oldest insertion first
+    return raw
+
+def _forget_info(url: str):
+    with _info_cache_lock:
+        _info_cache.pop(url, None)
+
+_EXTRACTOR_ARGS = {
+    # try multiple client types to mitigate SABR/web-only issues
+    "youtube": {
+        "player_client": ["web", "android", "tv", "ios"]
+    }
+}
+_HTTP_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                   "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0 Safari/537.36"),
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://www.youtube.com/"
+}
+
+def _prefetch_info(url: str):
+    """Warm the extractor cache for url; errors are left for the real download to report."""
+    try:
+        with yt_dlp.YoutubeDL({
+            "quiet": True,
+            "extractor_retries": 3,
+            "http_headers": _HTTP_HEADERS,
+            "extractor_args": _EXTRACTOR_ARGS
+        }) as ydl:
+            _extract_raw_info(ydl, url)
+    except Exception as e:
+        logger.debug(f"Metadata prefetch failed for {url}: {e}")
+
 # ---------- UPDATED: yt-dlp fallback helper ----------
 def _download_with_fallback(
     url: str,
@@ -366,11 +742,15 @@ def _download_with_fallback(
     primary_format: str,
     ffmpeg_dir: str | None,
     has_ffmpeg: bool,
-    extra_headers: dict | None = None
+    extra_headers: dict | None = None,
+    progress_hooks: list | None = None
 ):
     """
     Attempt download with multiple progressively simpler format selectors.
+    The video is extracted once and each selector only re-runs format selection on it.
     On repeated failure, perform metadata probe and pick first playable format manually.
+    progress_hooks are passed to every downloading YoutubeDL; DownloadCancelled from a hook
+    stops the whole attempt instead of moving on to the next format.
     Returns (info_dict, final_format_used)
     """
     fallback_formats = [
@@ -380,50 +760,57 @@ def _download_with_fallback(
         "best[ext=mp4]/best",
         "best"  # last generic
     ]
-    extractor_args = {
-        # try multiple client types to mitigate SABR/web-only issues
-        "youtube": {
-            "player_client": ["web", "android", "tv", "ios"]
-        }
-    }
-    headers = {
-        "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                       "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0 Safari/537.36"),
-        "Accept-Language": "en-US,en;q=0.9",
-        "Referer": "https://www.youtube.com/"
-    }
+    extractor_args = _EXTRACTOR_ARGS
+    headers = dict(_HTTP_HEADERS)
     if extra_headers:
         headers.update(extra_headers)
+    # Fragments and pre-merge parts go to the temp dir; only the final file lands in the output dir
+    out_dir, out_name = os.path.split(base_outtmpl)
+    location = {"outtmpl": out_name, "paths": {"home": out_dir, "temp": tempfile.gettempdir()}}
+    fragment_jobs = min(8, max(4, os.cpu_count() or 1))
 
     last_err = None
-    for fmt in fallback_formats:
-        opts = {
-            "outtmpl": base_outtmpl,
-            "format": fmt,
-            "ignoreerrors": False,
-            "merge_output_format": "mp4" if has_ffmpeg else None,
-            "retries": 3,
-            "fragment_retries": 3,
-            "extractor_retries": 3,
-            "concurrent_fragment_downloads": 1,
-            "http_headers": headers,
-            "quiet": True,
-            "noprogress": True,
-            "extractor_args": extractor_args
-        }
-        if ffmpeg_dir and has_ffmpeg:
-            opts["ffmpeg_location"] = ffmpeg_dir
-        try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(url, download=True)
+    opts = {
+        **location,
+        "format": fallback_formats[0],
+        "ignoreerrors": False,
+        "merge_output_format": "mp4" if has_ffmpeg else None,
+        "retries": 3,
+        "fragment_retries": 3,
+        "extractor_retries": 3,
+        "concurrent_fragment_downloads": fragment_jobs,
+        "http_headers": headers,
+        "quiet": True,
+        "noprogress": True,
+        "extractor_args": extractor_args,
+        "progress_hooks": progress_hooks or [],
+        **_external_downloader_opts()
+    }
+    if ffmpeg_dir and has_ffmpeg:
+        opts["ffmpeg_location"] = ffmpeg_dir
+    # One YoutubeDL (extractors, cookies, open connections) serves every selector;
+    # only its format selector is swapped between attempts
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        for fmt in fallback_formats:
+            try:
+                ydl.params["format"] = fmt
+                ydl.format_selector = ydl.build_format_selector(fmt)
+                # process_ie_result fills in the dict, so keep the cached copy pristine
+                raw = _extract_raw_info(ydl, url)
+                info = ydl.process_ie_result(copy.deepcopy(raw), download=True)
                 return info, fmt
-        except Exception as e:
-            last_err = e
-            emsg = str(e)
-            if isinstance(e, DownloadError):
-                logger.warning(f"Format selector '{fmt}' failed: {emsg}")
-            else:
-                logger.warning(f"Unexpected failure '{fmt}': {emsg}")
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                last_err = e
+                emsg = str(e)
+                if isinstance(e, DownloadError):
+                    logger.warning(f"Format selector '{fmt}' failed: {emsg}")
+                else:
+                    logger.warning(f"Unexpected failure '{fmt}': {emsg}")
+
+    # Cached extraction may be stale (expired stream URLs); start fresh next time
+    _forget_info(url)
 
     # Manual probe & selection
     try:
@@ -445,11 +832,13 @@ def _download_with_fallback(
             with yt_dlp.YoutubeDL({
                 "quiet": True,
                 "format": manual_fmt,
-                "outtmpl": base_outtmpl,
+                **location,
                 "ignoreerrors": False,
                 "merge_output_format": "mp4" if has_ffmpeg else None,
                 "http_headers": headers,
-                "extractor_args": extractor_args
+                "extractor_args": extractor_args,
+                "progress_hooks": progress_hooks or [],
+                **_external_downloader_opts()
             }) as ydl2:
                 info2 = ydl2.extract_info(url, download=True)
                 return info2, manual_fmt
@@ -460,11 +849,13 @@ def _download_with_fallback(
             with yt_dlp.YoutubeDL({
                 "quiet": True,
                 "format": combo,
-                "outtmpl": base_outtmpl,
+                **location,
                 "ignoreerrors": False,
                 "merge_output_format": "mp4" if has_ffmpeg else None,
                 "http_headers": headers,
-                "extractor_args": extractor_args
+                "extractor_args": extractor_args,
+                "progress_hooks": progress_hooks or [],
+                **_external_downloader_opts()
             }) as ydl3:
                 info3 = ydl3.extract_info(url, download=True)
                 return info3, combo
@@ -472,15 +863,36 @@ def _download_with_fallback(
         if last_err:
             raise last_err
         raise DownloadError("No playable formats located after probe.")
+    except DownloadCancelled:
+        raise
     except Exception as probe_err:
         if last_err:
             raise last_err
         raise probe_err
 
+def _find_downloaded_file(outdir: Path, video_id: str, ext: str) -> Optional[Path]:
+    """
+    One directory pass for a file whose name contains video_id, preferring the .ext one.
+    scandir names come from readdir, so only candidate entries are stat'ed.
+    """
+    suffix = f".{ext}"
+    fallback = None
+    with os.scandir(outdir) as entries:
+        for entry in entries:
+            if video_id not in entry.name or not entry.is_file():
+                continue
+            if entry.name.endswith(suffix):
+                return Path(entry.path)
+            fallback = fallback or Path(entry.path)
+    return fallback
+
+_TENTHS_MB_PER_BYTE = 10 / (1024 * 1024)
+
 class DownloadWorker(QThread):
     """Worker thread for downloading videos."""
     
     progress_updated = pyqtSignal(str, float, str, str)  # task_id, progress, speed, eta
+    PROGRESS_INTERVAL_S = 0.1  # at most ~10 progress signals per second
     status_changed = pyqtSignal(str, TaskStatus)  # task_id, status
     error_occurred = pyqtSignal(str, str)  # task_id, error_message
     download_completed = pyqtSignal(str, str, list)  # task_id, file_path, segments
@@ -489,6 +901,8 @@ class DownloadWorker(QThread):
         super().__init__()
         self.task = task
         self._cancelled = False
+        self._last_emit = 0.0
+        self._last_speed = (-1, "Unknown")  # (tenths of MB/s, rendered text)
     
     def cancel(self):
         """Cancel the download."""
@@ -504,20 +918,7 @@ class DownloadWorker(QThread):
             ffmpeg_path, ffprobe_path, ffmpeg_dir = _locate_ffmpeg()
             has_ffmpeg = bool(ffmpeg_path and ffprobe_path)
 
-            # Pre-fetch metadata for title (safe even without ffmpeg)
-            preliminary_opts = {
-                'quiet': True,
-                'skip_download': True,
-                'ignoreerrors': False,
-            }
-            try:
-                with yt_dlp.YoutubeDL(preliminary_opts) as meta_ydl:
-                    info = meta_ydl.extract_info(self.task.url, download=False)
-                    if info:
-                        self.task.title = info.get('title') or self.task.title
-            except Exception:
-                pass  # keep going
-
+            info = None
             splitting_required = self.task.should_split
             video_processing_required = (self.task.task_type != TaskType.AUDIO_ONLY)
 
@@ -535,25 +936,34 @@ class DownloadWorker(QThread):
                         "FFmpeg not found. Required for this operation (video muxing / splitting)."
                     )
 
-            if ffmpeg_dir:
-                os.environ["PATH"] = ffmpeg_dir + os.pathsep + os.environ.get("PATH", "")
-
             # Replace original outdir logic with custom directory support
-            custom_dir = getattr(self.task, "custom_download_dir", None)
+            custom_dir = self.task.custom_download_dir
             outdir = _prepare_download_dir(custom_dir)
             outdir.mkdir(parents=True, exist_ok=True)
 
             def progress_hook(d):
                 if self._cancelled:
-                    raise Exception("Download cancelled by user")
+                    raise DownloadCancelled("Download cancelled by user")
                 if d.get('status') == 'downloading':
+                    # Title comes with the first progress event; no separate metadata request
+                    if not self.task.title:
+                        self.task.title = (d.get('info_dict') or {}).get('title') or ""
                     progress = 0.0
                     total = d.get('total_bytes') or d.get('total_bytes_estimate')
                     if total:
                         progress = (d.get('downloaded_bytes', 0) / total) * 100
+                    # Drop intermediate updates; the final one always goes through
+                    now = time.monotonic()
+                    if now - self._last_emit < self.PROGRESS_INTERVAL_S and progress < 99.9:
+                        return
+                    self._last_emit = now
                     speed = d.get('speed') or 0
                     eta = d.get('eta') or 0
-                    speed_str = f"{speed/1024/1024:.1f} MB/s" if speed else "Unknown"
+                    # Re-render the speed text only when its displayed value changes
+                    tenths = round(speed * _TENTHS_MB_PER_BYTE) if speed else -1
+                    if tenths != self._last_speed[0]:
+                        self._last_speed = (tenths, f"{tenths / 10:.1f} MB/s" if speed else "Unknown")
+                    speed_str = self._last_speed[1]
                     eta_str = f"{eta}s" if eta else "Unknown"
                     self.progress_updated.emit(self.task.id, progress, speed_str, eta_str)
 
@@ -571,20 +981,24 @@ class DownloadWorker(QThread):
                 base_outtmpl=base_outtmpl,
                 primary_format=format_selector,
                 ffmpeg_dir=ffmpeg_dir if has_ffmpeg else None,
-                has_ffmpeg=has_ffmpeg
+                has_ffmpeg=has_ffmpeg,
+                progress_hooks=[progress_hook]
             )
             if info and not self.task.title:
                 self.task.title = info.get('title') or self.task.title
             logger.debug(f"Final format used: {used_fmt}")
 
-            # Resolve downloaded file (re-using previous logic)
-            search_ext = self.task.output_format if (has_ffmpeg and not fallback_no_ffmpeg) else "mp4"
-            downloaded_files = list(outdir.glob(f"*{info['id']}*.{search_ext}")) if info else []
-            if not downloaded_files:
-                downloaded_files = list(outdir.glob(f"*{info['id']}*"))
-            if not downloaded_files:
-                raise Exception("Downloaded file not found after yt-dlp run.")
-            file_path = downloaded_files[0]
+            # Resolve downloaded file: yt-dlp reports the final (merged) path itself
+            requested = (info or {}).get('requested_downloads') or []
+            reported = requested[0].get('filepath') if requested else (info or {}).get('_filename')
+            if reported and Path(reported).is_file():
+                file_path = Path(reported)
+            else:
+                # Fallback: scan the output folder (previous logic)
+                search_ext = self.task.output_format if (has_ffmpeg and not fallback_no_ffmpeg) else "mp4"
+                file_path = _find_downloaded_file(outdir, info['id'], search_ext) if info else None
+                if file_path is None:
+                    raise Exception("Downloaded file not found after yt-dlp run.")
             segments = []
 
             if self.task.should_split:
@@ -592,39 +1006,43 @@ class DownloadWorker(QThread):
                     raise RuntimeError("Splitting requested but ffmpeg is not available.")
                 self.status_changed.emit(self.task.id, TaskStatus.PROCESSING)
                 try:
-                    # Trim video before splitting if needed
-                    trimmed_file = file_path
-                    head = getattr(self.task, "cut_head_seconds", 0)
-                    tail = getattr(self.task, "cut_tail_seconds", 0)
-                    if head > 0 or tail > 0:
-                        trimmed_file = outdir / f"{file_path.stem}_trimmed{file_path.suffix}"
-                        duration = get_video_duration(file_path)
-                        start = head
-                        end = duration - tail if tail > 0 else duration
-                        trim_duration = max(0, end - start)
-                        trim_cmd = [
-                            "ffmpeg", "-y",
-                            "-i", str(file_path),
-                            "-ss", str(start),
-                            "-t", str(trim_duration),
-                            "-c", "copy",
-                            str(trimmed_file)
-                        ]
-                        subprocess.run(trim_cmd, check=True)
+                    # Cut head/tail inside the split pass instead of writing a trimmed copy first
+                    head = self.task.cut_head_seconds
+                    tail = self.task.cut_tail_seconds
+                    keep = None
+                    # yt-dlp already reported duration and frame size; split probes only if it did not
+                    duration = (info or {}).get("duration")
+                    width, height = (info or {}).get("width"), (info or {}).get("height")
+                    if tail > 0:
+                        keep = max(0, (duration or get_video_duration(file_path)) - tail - head)
                     segments = split_and_mark_video(
-                        trimmed_file,
+                        file_path,
                         str(outdir),
                         self.task.segment_duration,
                         self.task.title_prefix,
                         self.task.overlay_title or self.task.title,
-                        speed_factor=self.task.speed_factor
+                        speed_factor=self.task.speed_factor,
+                        start_offset=head,
+                        max_duration=keep,
+                        should_cancel=lambda: self._cancelled,
+                        burn_text=self.task.burn_text,
+                        duration=duration,
+                        source_size=(width, height) if width and height else None,
+                        on_progress=lambda pct, speed: self.progress_updated.emit(
+                            self.task.id, pct, speed, "Unknown"
+                        )
                     )
+                except DownloadCancelled:
+                    raise
                 except Exception as split_error:
                     logger.warning(f"Failed to split video: {split_error}")
 
             self.download_completed.emit(self.task.id, str(file_path), segments)
             self.status_changed.emit(self.task.id, TaskStatus.COMPLETED)
 
+        except DownloadCancelled:
+            logger.info(f"Download cancelled for task {self.task.id}")
+            self.status_changed.emit(self.task.id, TaskStatus.CANCELLED)
         except Exception as e:
             msg = str(e)
             if "ffmpeg" in msg.lower():
@@ -721,17 +1139,30 @@ class DownloadService(QObject):
     
     def __init__(self):
         super().__init__()
-        # Override Config.DOWNLOADS_DIR once with a stable absolute path
+        # Override Config.instance().DOWNLOADS_DIR once with a stable absolute path
         try:
-            Config.DOWNLOADS_DIR = _stable_download_dir()
+            Config.instance().DOWNLOADS_DIR = _stable_download_dir()
         except Exception as e:
             # Fallback to existing value if something unexpected happens
             logger.warning(f"Failed to set stable download dir, using default: {e}")
         self.active_workers = {}
         self.tasks = {}
-        self.queue = []  # task ids waiting
-        self.max_concurrent = Config.MAX_CONCURRENT_DOWNLOADS
+        self._active_urls: dict[str, str] = {}  # url -> task id of its non-terminal task
+        self._tasks_by_url: dict[str, DownloadTask] = {}  # url -> most recently added task
+        self.queue = deque()  # task ids waiting; cancelled ids are skipped when popped
+        self._queued = set()  # ids in self.queue that are still waiting
+        self._prefetched = set()  # urls already handed to _prefetch_info
+        self.max_concurrent = Config.instance().MAX_CONCURRENT_DOWNLOADS
         self._apply_resource_tuning()
+        self._expose_ffmpeg_on_path()
+
+    @staticmethod
+    def _expose_ffmpeg_on_path():
+        """Put the located ffmpeg dir on PATH once so bare "ffmpeg"/"ffprobe" calls resolve to it."""
+        _, _, ffmpeg_dir = _locate_ffmpeg()
+        path = os.environ.get("PATH", "")
+        if ffmpeg_dir and ffmpeg_dir not in path.split(os.pathsep):
+            os.environ["PATH"] = ffmpeg_dir + os.pathsep + path
 
     def _apply_resource_tuning(self):
         limits = _compute_resource_limits()
@@ -762,7 +1193,8 @@ class DownloadService(QObject):
                           ask_directory: bool = False,
                           cut_head_seconds: int = 0,
                           cut_tail_seconds: int = 0,
-                          speed_factor: float = 1.0) -> DownloadTask:
+                          speed_factor: float = 1.0,
+                          burn_text: bool = True) -> DownloadTask:
         # Capacity advisory (does not block, only warns)
         active_or_queued = sum(
             1 for t in self.tasks.values()
@@ -776,10 +1208,11 @@ class DownloadService(QObject):
             )
         if resolution and not resolution_height:
             resolution_height = resolution
+        url = sys.intern(url)
         task = DownloadTask(
             url=url,
             task_type=task_type,
-            output_format=output_format or Config.DEFAULT_OUTPUT_FORMAT,
+            output_format=output_format or Config.instance().DEFAULT_OUTPUT_FORMAT,
             should_split=should_split,
             segment_duration=segment_duration,
             title_prefix=title_prefix,
@@ -788,21 +1221,37 @@ class DownloadService(QObject):
             resolution_height=resolution_height,
             cut_head_seconds=cut_head_seconds,
             cut_tail_seconds=cut_tail_seconds,
-            speed_factor=speed_factor
+            speed_factor=speed_factor,
+            burn_text=burn_text
         )
         # Custom directory handling
         if download_dir:
-            setattr(task, "custom_download_dir", str(download_dir))
+            task.custom_download_dir = str(download_dir)
         elif ask_directory:
             # Mark as pending directory selection
-            setattr(task, "custom_download_dir", None)
+            task.custom_download_dir = None
         self.tasks[task.id] = task
+        self._active_urls[url] = task.id
+        self._tasks_by_url[url] = task
         self.task_added.emit(task)
         if ask_directory and not download_dir:
             # Notify GUI to open folder chooser
             self.download_directory_requested.emit(task.id)
         return task
 
+    def is_url_active(self, url: str) -> bool:
+        """Return True if a task for url exists that has not finished, failed or been cancelled."""
+        return url in self._active_urls
+
+    def find_task_by_url(self, url: str) -> Optional[DownloadTask]:
+        """Return the most recently added task for url, if any."""
+        return self._tasks_by_url.get(url)
+
+    def _release_active_url(self, task: DownloadTask):
+        """Drop task from the active-url index once it reaches a terminal status."""
+        if self._active_urls.get(task.url) == task.id:
+            del self._active_urls[task.url]
+
     def confirm_and_start(self, task_id: str, directory: str | Path):
         """
         GUI helper: set directory picked by user and start download.
@@ -813,40 +1262,59 @@ class DownloadService(QObject):
             return
         if task.status not in (TaskStatus.PENDING, TaskStatus.QUEUED):
             return
-        setattr(task, "custom_download_dir", str(directory))
+        task.custom_download_dir = str(directory)
         self.task_updated.emit(task)
         self.start_download(task_id)
 
+    @pyqtSlot(str)
     def start_download(self, task_id: str):
         """Start downloading a task (will request directory first if missing)."""
         if task_id not in self.tasks:
             return
         task = self.tasks[task_id]
         # If directory not chosen yet, trigger request
-        if getattr(task, "custom_download_dir", True) is None:
+        if task.custom_download_dir is None:
             self.download_directory_requested.emit(task.id)
             return
         # If already active or queued, skip
         if task.status in (TaskStatus.DOWNLOADING, TaskStatus.PROCESSING, TaskStatus.QUEUED):
             return
+        # A restarted (e.g. previously cancelled) task is active again for the duplicate-URL guard
+        self._active_urls[task.url] = task.id
         if len(self.active_workers) >= self.max_concurrent:
             task.status = TaskStatus.QUEUED
             self.task_updated.emit(task)
-            if task_id not in self.queue:
+            if task_id not in self._queued:
+                self._queued.add(task_id)
                 self.queue.append(task_id)
+                self._prefetch_next()
             return
         self._launch_worker(task)
 
     def _launch_worker(self, task: DownloadTask):
         worker = DownloadWorker(task)
         # Connect signals
-        worker.progress_updated.connect(self._on_progress_updated)
-        worker.status_changed.connect(self._on_status_changed)
-        worker.error_occurred.connect(self._on_error_occurred)
-        worker.download_completed.connect(self._on_download_completed)
-        worker.finished.connect(lambda: self._on_worker_finished(task.id))
+        # Worker signals are emitted from the download thread; handle them on this object's thread
+        queued = Qt.ConnectionType.QueuedConnection
+        worker.progress_updated.connect(self._on_progress_updated, queued)
+        worker.status_changed.connect(self._on_status_changed, queued)
+        worker.error_occurred.connect(self._on_error_occurred, queued)
+        worker.download_completed.connect(self._on_download_completed, queued)
+        worker.finished.connect(lambda: self._on_worker_finished(task.id), queued)
         self.active_workers[task.id] = worker
+        self._prefetched.discard(task.url)
         worker.start()
+        self._prefetch_next()
+
+    def _prefetch_next(self):
+        """Extract the next waiting task's video in the background while slots are busy."""
+        next_id = next((tid for tid in self.queue if tid in self._queued), None)
+        task = self.tasks.get(next_id)
+        if task is None or task.url in self._prefetched:
+            return
+        self._prefetched.add(task.url)
+        # Daemon thread: an unfinished prefetch must not hold up application exit
+        threading.Thread(target=_prefetch_info, args=(task.url,), daemon=True).start()
 
     def _on_worker_finished(self, task_id: str):
         if task_id in self.active_workers:
@@ -856,23 +1324,28 @@ class DownloadService(QObject):
 
     def _maybe_start_next(self):
         while self.queue and len(self.active_workers) < self.max_concurrent:
-            next_id = self.queue.pop(0)
+            next_id = self.queue.popleft()
+            if next_id not in self._queued:
+                continue  # cancelled while waiting
+            self._queued.discard(next_id)
             if next_id in self.tasks:
                 t = self.tasks[next_id]
                 if t.status == TaskStatus.QUEUED:
                     self._launch_worker(t)
 
+    @pyqtSlot(str)
     def cancel_download(self, task_id: str):
         # Cancel active worker
         if task_id in self.active_workers:
             self.active_workers[task_id].cancel()
             return
         # Cancel queued
-        if task_id in self.queue:
-            self.queue.remove(task_id)
+        if task_id in self._queued:
+            self._queued.discard(task_id)
             if task_id in self.tasks:
                 t = self.tasks[task_id]
                 t.status = TaskStatus.CANCELLED
+                self._release_active_url(t)
                 self.task_updated.emit(t)
 
     def _on_progress_updated(self, task_id: str, progress: float, speed: str, eta: str):
@@ -889,6 +1362,8 @@ class DownloadService(QObject):
         if task_id in self.tasks:
             task = self.tasks[task_id]
             task.status = status
+            if status in TERMINAL_STATUSES:
+                self._release_active_url(task)
             self.task_updated.emit(task)
     
     def _on_error_occurred(self, task_id: str, error_message: str):
@@ -906,6 +1381,3 @@ class DownloadService(QObject):
             if segments:
                 task.segments = [Path(seg) for seg in segments]
             self.task_updated.emit(task)
-            if segments:
-                task.segments = [Path(seg) for seg in segments]
-            self.task_updated.emit(task)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 import json
+import tempfile
 from pathlib import Path
 from typing import Any, Optional
 import time
 import platform
 import os
+try:
+    import orjson  # optional: faster (de)serialization of large cache payloads
+except Exception:
+    orjson = None
 
 def _base_dir() -> Path:
     sys = platform.system().lower()
@@ -21,6 +26,12 @@ def _base_dir() -> Path:
 def cache_path(name: str) -> Path:
     return _base_dir() / name
 
+def _dumps(data: Any) -> bytes:
+    if orjson:
+        # Non-string keys are stringified, as json.dumps does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 def load_json(name: str, max_age_sec: Optional[int] = None) -> Optional[Any]:
     p = cache_path(name)
     if not p.exists():
@@ -29,14 +40,22 @@ def load_json(name: str, max_age_sec: Optional[int] = None) -> Optional[Any]:
         if time.time() - p.stat().st_mtime > max_age_sec:
             return None
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        raw = p.read_bytes()  # both parsers take UTF-8 bytes directly
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except Exception:
         return None
 
 def write_json(name: str, data: Any):
     p = cache_path(name)
+    # Unique sibling temp file per writer, then rename over the target: readers never see a
+    # half-written file and concurrent writers (threads included) never share a temp file
+    tmp = None
     try:
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=f"{p.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_dumps(data))
+        os.replace(tmp, p)
     except Exception:
-        pass
+        if tmp:
+            Path(tmp).unlink(missing_ok=True)
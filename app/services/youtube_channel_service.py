@@ -8,8 +8,13 @@ import time
 import ssl
 import socket
 import random  # added
+import tempfile
 import sys  # <-- added import (fix NameError for sys.platform in _CACHE_BASE)
 from shutil import copy2  # new
+try:
+    import orjson  # optional: faster (de)serialization of the subscription/video caches
+except Exception:
+    orjson = None
 
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
 
@@ -81,16 +86,30 @@ def _read_json(p: Path):
     try:
         if not p.exists():
             return None
-        return json.loads(p.read_text(encoding="utf-8"))
+        raw = p.read_bytes()  # both parsers take UTF-8 bytes directly
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except Exception:
         return None
 
+def _dumps(data) -> bytes:
+    if orjson:
+        # Non-string keys are stringified, as json.dumps does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 def _write_json(p: Path, data):
+    # Unique sibling temp file per writer, then rename over the target: worker threads
+    # writing the same cache never share a temp file and readers never see a partial one
+    tmp = None
     try:
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=f"{p.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_dumps(data))
+        os.replace(tmp, p)
     except Exception:
-        pass
+        if tmp:
+            Path(tmp).unlink(missing_ok=True)
 
 def _is_fresh(p: Path, ttl: int) -> bool:
     return p.exists() and (time.time() - p.stat().st_mtime) < ttl
@@ -139,7 +158,8 @@ class YouTubeChannelService(QObject):
         self.last_error = None
         self._playlist_cache = _read_json(_PLAYLIST_CACHE_FILE) or {}
         self._migrate_legacy_token()
-        self._silent_restore()
+        # Saved credentials are restored by ensure_session()/ensure_session_async(),
+        # so constructing the service does no token or network I/O
 
     def _migrate_legacy_token(self):
         """Copy legacy token.json (project root) to user data dir once."""
@@ -151,7 +171,8 @@ class YouTubeChannelService(QObject):
             pass
 
     # ---------------- AUTH RESTORE ----------------
-    def _silent_restore(self):
+    def _restore_saved_session(self):
+        """Load (and refresh if expired) the saved token; returns (creds, client) or None. Safe off the GUI thread."""
         try:
             if TOKEN_FILE.exists():
                 creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
@@ -161,11 +182,18 @@ class YouTubeChannelService(QObject):
                     except Exception:
                         pass
                 if creds and creds.valid:
-                    self._creds = creds
-                    self._youtube = build("youtube", "v3", credentials=self._creds, cache_discovery=False)
-                    self.auth_changed.emit(True)
+                    return creds, build("youtube", "v3", credentials=creds, cache_discovery=False)
         except Exception as e:
             self.last_error = str(e)
+        return None
+
+    def _apply_restored_session(self, restored):
+        if restored:
+            self._creds, self._youtube = restored
+            self.auth_changed.emit(True)
+
+    def _silent_restore(self):
+        self._apply_restored_session(self._restore_saved_session())
 
     def ensure_session(self):
         """
@@ -179,6 +207,18 @@ class YouTubeChannelService(QObject):
         self._silent_restore()
         return bool(self._creds and self._creds.valid)
 
+    def ensure_session_async(self):
+        """
+        Like ensure_session(), but restores saved credentials on a worker thread.
+        Emits auth_changed(True) once a valid session is available; stays silent otherwise.
+        """
+        if self._creds and self._creds.valid:
+            self.auth_changed.emit(True)
+            return
+        worker = _Worker(self._restore_saved_session)
+        worker.finished.connect(lambda: self._apply_restored_session(worker.result))
+        worker.start()
+
     # ---------------- INTERACTIVE AUTH (RESTORED) ----------------
     def authenticate(self, force: bool = False):
         """